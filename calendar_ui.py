@@ -3,14 +3,56 @@ Calendar UI module with Windows 11 dark theme to display shows.
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+from tkinter import font as tkfont
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import calendar as cal_lib
+from functools import lru_cache
+
+
+@lru_cache(maxsize=128)
+def month_layout(year: int, month: int) -> Tuple[int, Tuple[Tuple[Optional[int], Optional[str]], ...]]:
+    """
+    Get the calendar grid layout for a month.
+    
+    Args:
+        year: Year of the month to lay out
+        month: Month number (1-12)
+        
+    Returns:
+        (first weekday, 0 = Monday) and the 42 (day, 'YYYY-MM-DD') cells in
+        row-major order, with (None, None) for blank cells
+    """
+    first_weekday, num_days = cal_lib.monthrange(year, month)
+    
+    layout = [(None, None)] * first_weekday
+    layout += [(day, f"{year:04d}-{month:02d}-{day:02d}") for day in range(1, num_days + 1)]
+    layout += [(None, None)] * (42 - len(layout))
+    return first_weekday, tuple(layout)
+
+
+def bind_hover_buttons(root: tk.Misc):
+    """
+    Register the class binding that gives 'HoverButton'-tagged buttons their hover colors.
+    
+    Buttons opt in by adding 'HoverButton' to their bindtags and setting normal_bg
+    and hover_bg. Safe to call more than once; the binding is only added the first time.
+    
+    Args:
+        root: Any widget of the Tk application to register the binding on
+    """
+    if root.bind_class('HoverButton', '<Enter>'):
+        return
+    root.bind_class('HoverButton', '<Enter>', lambda e: e.widget.config(bg=e.widget.hover_bg))
+    root.bind_class('HoverButton', '<Leave>', lambda e: e.widget.config(bg=e.widget.normal_bg))
 
 
 class CalendarUI:
     """Windows 11 styled calendar UI to display shows."""
     
+    # Shows listed in a day cell before the rest are summarised as "+N more"
+    MAX_SHOWS_PER_CELL = 3
+    
     def __init__(self, parent):
         self.root = parent if isinstance(parent, tk.Tk) else parent.winfo_toplevel()
         self.parent = parent
@@ -40,12 +82,40 @@ class CalendarUI:
         self.font_bold = (self.font_family, 10, 'bold')
         
         self.shows = []  # List of show dictionaries
+        self._shows_by_date = {}  # 'YYYY-MM-DD' -> list of shows on that date
         self.current_date = datetime.now()
         
+        # Last rendered state per cell and reusable show buttons per cell
+        self._cell_state = [[None] * 7 for _ in range(6)]
+        self._show_btn_pool = [[[] for _ in range(7)] for _ in range(6)]
+        self._redraw_pending = False
+        
         self.setup_ui()
     
     def setup_ui(self):
         """Set up the user interface."""
+        # Show buttons share one ttk style so hover colors are handled by Tk
+        # instead of per-button Python callbacks
+        self.style = ttk.Style(self.root)
+        self.style.configure(
+            'Show.TButton',
+            background=self.colors['secondary_bg'],
+            foreground=self.colors['fg'],
+            font=self.font_small,
+            anchor='w',
+            borderwidth=0,
+            relief=tk.FLAT,
+            padding=(4, 1)
+        )
+        self.style.map(
+            'Show.TButton',
+            background=[('pressed', self.colors['accent']), ('active', self.colors['hover'])],
+            foreground=[('active', self.colors['fg'])]
+        )
+        
+        # Hover colors for the buttons from create_button
+        bind_hover_buttons(self.root)
+        
         # Main container
         main_frame = tk.Frame(self.parent, bg=self.colors['bg'])
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
@@ -111,12 +181,16 @@ class CalendarUI:
             label.grid(row=0, column=i, padx=3, pady=3, sticky='nsew')
         
         # Calendar grid
+        cell_height = self.cell_height()
         self.calendar_cells = []
         for row in range(6):
             row_cells = []
             for col in range(7):
                 cell_frame = self.create_card(calendar_frame)
                 cell_frame.grid(row=row+1, column=col, padx=3, pady=3, sticky='nsew')
+                # Fixed requested size so changing a cell's text never relayouts its siblings
+                cell_frame.config(width=150, height=cell_height)
+                cell_frame.pack_propagate(False)
                 
                 # Date label
                 date_label = tk.Label(
@@ -137,19 +211,35 @@ class CalendarUI:
                 row_cells.append({
                     'frame': cell_frame,
                     'date_label': date_label,
-                    'shows_frame': shows_frame
+                    'shows_frame': shows_frame,
+                    'more_label': None  # Created on first use, most days never overflow
                 })
             self.calendar_cells.append(row_cells)
         
         # Configure grid weights
         for i in range(7):
-            calendar_frame.columnconfigure(i, weight=1)
+            calendar_frame.columnconfigure(i, weight=1, uniform='day')
         for i in range(6):
-            calendar_frame.rowconfigure(i+1, weight=1)
+            calendar_frame.rowconfigure(i+1, weight=1, uniform='week')
         
         # Update calendar display
         self.update_calendar()
     
+    def cell_height(self) -> int:
+        """
+        Height a day cell needs for its date, MAX_SHOWS_PER_CELL show buttons and the "+N more" label.
+        
+        Returns:
+            Height in pixels, measured from the fonts in use
+        """
+        bold_line = tkfont.Font(root=self.root, font=self.font_bold).metrics('linespace')
+        small_line = tkfont.Font(root=self.root, font=self.font_small).metrics('linespace')
+        
+        date_height = bold_line + 2 + 12  # Label border plus pady=6 above and below
+        button_height = small_line + 2 + 2 + 4  # Style padding, pack pady and the theme's button border
+        more_height = small_line + 4  # Label border and default pady
+        return date_height + self.MAX_SHOWS_PER_CELL * button_height + more_height + 4
+    
     def create_card(self, parent) -> tk.Frame:
         """Create a card-style frame with Windows 11 styling."""
         card = tk.Frame(
@@ -181,15 +271,10 @@ class CalendarUI:
             width=width
         )
         
-        # Add hover effect
-        def on_enter(e):
-            btn.config(bg=hover_color)
-        
-        def on_leave(e):
-            btn.config(bg=bg_color)
-        
-        btn.bind('<Enter>', on_enter)
-        btn.bind('<Leave>', on_leave)
+        # Hover colors are applied by the shared 'HoverButton' class binding
+        btn.normal_bg = bg_color
+        btn.hover_bg = hover_color
+        btn.bindtags(('HoverButton',) + btn.bindtags())
         
         return btn
     
@@ -199,7 +284,7 @@ class CalendarUI:
             self.current_date = self.current_date.replace(year=self.current_date.year - 1, month=12)
         else:
             self.current_date = self.current_date.replace(month=self.current_date.month - 1)
-        self.update_calendar()
+        self.request_redraw()
     
     def next_month(self):
         """Navigate to next month."""
@@ -207,17 +292,16 @@ class CalendarUI:
             self.current_date = self.current_date.replace(year=self.current_date.year + 1, month=1)
         else:
             self.current_date = self.current_date.replace(month=self.current_date.month + 1)
-        self.update_calendar()
+        self.request_redraw()
     
     def go_to_today(self):
         """Navigate to current month."""
         self.current_date = datetime.now()
-        self.update_calendar()
+        self.request_redraw()
     
     def get_shows_for_date(self, date: datetime) -> List[Dict]:
         """Get all shows for a specific date."""
-        date_str = date.strftime('%Y-%m-%d')
-        return [show for show in self.shows if show.get('date') == date_str]
+        return self._shows_by_date.get(date.strftime('%Y-%m-%d'), [])
     
     def on_show_click(self, show: Dict):
         """Handle click on a show item."""
@@ -231,102 +315,102 @@ class CalendarUI:
         
         messagebox.showinfo("Show Details", details)
     
+    def request_redraw(self):
+        """Schedule a calendar redraw, coalescing repeated requests into one when Tk is idle."""
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.root.after_idle(self._do_redraw)
+    
+    def _do_redraw(self):
+        """Run a redraw scheduled by request_redraw."""
+        self._redraw_pending = False
+        # The view may have been torn down before the idle callback ran
+        if self.month_label.winfo_exists():
+            self.update_calendar()
+    
     def update_calendar(self):
         """Update the calendar display with shows."""
         # Update month label
         month_name = self.current_date.strftime('%B %Y')
         self.month_label.config(text=month_name)
         
-        # Get first day of month and number of days
-        first_day = self.current_date.replace(day=1)
-        first_weekday = first_day.weekday()  # 0 = Monday, 6 = Sunday
-        num_days = cal_lib.monthrange(self.current_date.year, self.current_date.month)[1]
+        year = self.current_date.year
+        month = self.current_date.month
+        first_weekday, layout = month_layout(year, month)
         
-        # Clear all cells
-        for row in self.calendar_cells:
-            for cell in row:
-                cell['date_label'].config(text='', bg=self.colors['card_bg'], fg=self.colors['fg'])
-                # Clear shows
-                for widget in cell['shows_frame'].winfo_children():
-                    widget.destroy()
+        # Locate today's cell once instead of testing every cell
+        today = datetime.now()
+        if today.year == year and today.month == month:
+            today_idx = first_weekday + today.day - 1
+        else:
+            today_idx = -1
         
-        # Fill calendar
-        current_day = 1
-        start_row = 0
-        start_col = first_weekday
+        # Fill calendar, only touching cells whose contents changed
+        for idx, (day, date_str) in enumerate(layout):
+            shows_for_date = self._shows_by_date.get(date_str, []) if day else []
+            self.render_cell(idx // 7, idx % 7, day, idx == today_idx, shows_for_date)
+    
+    def render_cell(self, row: int, col: int, day: Optional[int], is_today: bool, shows_for_date: List[Dict]):
+        """Update a single calendar cell, skipping it if nothing changed since the last draw."""
+        visible_shows = shows_for_date[:self.MAX_SHOWS_PER_CELL]
+        state = (day, is_today, tuple(visible_shows), len(shows_for_date))
+        if self._cell_state[row][col] == state:
+            return
+        self._cell_state[row][col] = state
         
-        for row in range(6):
-            for col in range(7):
-                if current_day > num_days:
-                    break
-                
-                if row == start_row and col < start_col:
-                    continue
-                
-                cell = self.calendar_cells[row][col]
-                date_obj = datetime(self.current_date.year, self.current_date.month, current_day)
-                
-                # Update date label
-                cell['date_label'].config(text=str(current_day))
-                
-                # Highlight today
-                today = datetime.now()
-                if (date_obj.year == today.year and 
-                    date_obj.month == today.month and 
-                    date_obj.day == today.day):
-                    cell['date_label'].config(bg=self.colors['today_bg'], fg=self.colors['today_fg'])
-                    cell['frame'].config(bg=self.colors['card_bg'])
-                else:
-                    cell['date_label'].config(bg=self.colors['card_bg'], fg=self.colors['fg'])
-                    cell['frame'].config(bg=self.colors['card_bg'])
-                
-                # Add shows for this date
-                shows_for_date = self.get_shows_for_date(date_obj)
-                for show in shows_for_date[:3]:  # Limit to 3 shows per day for display
-                    display_name = show.get('display_name', show.get('location', 'Unknown'))
-                    show_text = f"• {display_name[:18]}"
-                    if show.get('time') and show['time'] != 'Unknown':
-                        show_text += f" @ {show['time'][:5]}"
-                    
-                    show_btn = tk.Button(
-                        cell['shows_frame'],
-                        text=show_text,
-                        bg=self.colors['secondary_bg'],
-                        fg=self.colors['fg'],
-                        activebackground=self.colors['accent'],
-                        activeforeground=self.colors['fg'],
-                        borderwidth=0,
-                        font=self.font_small,
-                        anchor='w',
-                        command=lambda s=show: self.on_show_click(s),
-                        cursor='hand2',
-                        relief=tk.FLAT
-                    )
-                    show_btn.pack(fill=tk.X, padx=2, pady=1)
-                    
-                    # Add hover effect
-                    def on_enter(e, btn=show_btn):
-                        btn.config(bg=self.colors['hover'])
-                    
-                    def on_leave(e, btn=show_btn):
-                        btn.config(bg=self.colors['secondary_bg'])
-                    
-                    show_btn.bind('<Enter>', on_enter)
-                    show_btn.bind('<Leave>', on_leave)
-                
-                if len(shows_for_date) > 3:
-                    more_label = tk.Label(
-                        cell['shows_frame'],
-                        text=f"+{len(shows_for_date) - 3} more",
-                        bg=self.colors['card_bg'],
-                        fg=self.colors['accent'],
-                        font=self.font_small
-                    )
-                    more_label.pack(fill=tk.X, padx=2)
-                
-                current_day += 1
+        cell = self.calendar_cells[row][col]
+        
+        # Update date label
+        if is_today:
+            cell['date_label'].config(text=str(day), bg=self.colors['today_bg'], fg=self.colors['today_fg'])
+        else:
+            cell['date_label'].config(text=str(day) if day else '', bg=self.colors['card_bg'], fg=self.colors['fg'])
+        
+        # Reuse pooled buttons, only creating new ones when the pool is too small
+        if cell['more_label']:
+            cell['more_label'].pack_forget()
+        pool = self._show_btn_pool[row][col]
+        for i, show in enumerate(visible_shows):
+            if i == len(pool):
+                pool.append(self.create_show_button(cell['shows_frame']))
+            pool[i].config(text=self.format_show_text(show), command=lambda s=show: self.on_show_click(s))
+            pool[i].pack(fill=tk.X, padx=2, pady=1)
+        
+        for show_btn in pool[len(visible_shows):]:
+            show_btn.pack_forget()
+        
+        if len(shows_for_date) > self.MAX_SHOWS_PER_CELL:
+            if not cell['more_label']:
+                cell['more_label'] = tk.Label(
+                    cell['shows_frame'],
+                    text='',
+                    bg=self.colors['card_bg'],
+                    fg=self.colors['accent'],
+                    font=self.font_small
+                )
+            cell['more_label'].config(text=f"+{len(shows_for_date) - self.MAX_SHOWS_PER_CELL} more")
+            cell['more_label'].pack(fill=tk.X, padx=2)
+    
+    def format_show_text(self, show: Dict) -> str:
+        """Build the short label shown for a show inside a calendar cell."""
+        display_name = show.get('display_name', show.get('location', 'Unknown'))
+        show_text = f"• {display_name[:18]}"
+        if show.get('time') and show['time'] != 'Unknown':
+            show_text += f" @ {show['time'][:5]}"
+        return show_text
+    
+    def create_show_button(self, parent) -> ttk.Button:
+        """Create a compact button for a show entry in a calendar cell."""
+        return ttk.Button(parent, text='', style='Show.TButton', cursor='hand2', takefocus=False)
     
     def set_shows(self, shows: List[Dict]):
         """Set the shows to display."""
-        self.shows = shows
-        self.update_calendar()
+        self.shows = list(shows)
+        
+        # Index shows by date so each calendar cell is a single lookup
+        self._shows_by_date = {}
+        for show in shows:
+            self._shows_by_date.setdefault(show.get('date'), []).append(show)
+        
+        self.request_redraw()
@@ -2,10 +2,14 @@
 Instagram scraper module to fetch posts from venue accounts.
 """
 import instaloader
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from itertools import islice
+from operator import itemgetter
 import time
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import random
 
@@ -13,8 +17,34 @@ import random
 class InstagramScraper:
     """Handles scraping Instagram posts from venue accounts."""
     
+    # Number of post images downloaded in parallel
+    IMAGE_DOWNLOAD_WORKERS = 4
+    
+    # Seconds a profile's fetched posts are reused instead of asking Instagram again
+    POST_CACHE_TTL = 300
+    
     def __init__(self, username: Optional[str] = None, password: Optional[str] = None):
-        self.loader = instaloader.Instaloader(
+        self.loader = self.create_loader()
+        
+        # Shared HTTP session so image downloads reuse keep-alive connections
+        self.http_session = requests.Session()
+        self.http_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        
+        # Recently fetched posts, keyed by (username, days_back, max_posts)
+        self.post_cache = {}
+        
+        # Try to load session if exists
+        self.session_file = 'instagram_session'
+        self.is_logged_in = False
+        
+        if username and password:
+            self.login(username, password)
+        else:
+            self.try_load_session()
+    
+    def create_loader(self) -> instaloader.Instaloader:
+        """Create an Instaloader that only fetches metadata."""
+        return instaloader.Instaloader(
             download_pictures=False,
             download_videos=False,
             download_video_thumbnails=False,
@@ -24,25 +54,41 @@ class InstagramScraper:
             compress_json=False,
             max_connection_attempts=1  # Reduce connection attempts
         )
+    
+    def relogin(self, username: Optional[str] = None, password: Optional[str] = None) -> bool:
+        """
+        Switch Instagram credentials in place.
         
-        # Try to load session if exists
-        self.session_file = 'instagram_session'
+        Only the Instaloader session (which holds the login cookies) is replaced;
+        the image download session is kept.
+        
+        Args:
+            username: Instagram username, or None to fall back to a saved session
+            password: Instagram password
+            
+        Returns:
+            True if logged in afterwards
+        """
+        self.loader.close()
+        self.loader = self.create_loader()
         self.is_logged_in = False
         
         if username and password:
-            self.login(username, password)
-        else:
-            self.try_load_session()
+            return self.login(username, password)
+        
+        self.try_load_session()
+        return self.is_logged_in
     
     def try_load_session(self):
         """Try to load existing session."""
         try:
             # Check if session file exists (instaloader uses username.session format)
             # We'll look for any .session file in current directory
-            session_files = [f for f in os.listdir('.') if f.endswith('.session')]
-            if session_files:
+            with os.scandir('.') as entries:
                 # Try to load the first session file found
-                username_from_file = session_files[0].replace('.session', '')
+                session_file = next((e.name for e in entries if e.name.endswith('.session') and e.is_file()), None)
+            if session_file:
+                username_from_file = session_file.replace('.session', '')
                 self.loader.load_session_from_file(username_from_file)
                 self.is_logged_in = True
                 print(f"✓ Loaded existing Instagram session for {username_from_file}")
@@ -81,18 +127,19 @@ class InstagramScraper:
         """Logout and remove session."""
         try:
             # Remove all .session files
-            session_files = [f for f in os.listdir('.') if f.endswith('.session')]
-            for session_file in session_files:
-                try:
-                    os.remove(session_file)
-                except:
-                    pass
+            with os.scandir('.') as entries:
+                for entry in entries:
+                    if entry.name.endswith('.session'):
+                        try:
+                            os.remove(entry.path)
+                        except:
+                            pass
             self.is_logged_in = False
             print("Logged out")
         except Exception as e:
             print(f"Error logging out: {e}")
     
-    def get_profile_posts(self, username: str, max_posts: int = 50, days_back: int = None) -> List[Dict]:
+    def get_profile_posts(self, username: str, max_posts: int = 50, days_back: int = None, download: bool = True) -> List[Dict]:
         """
         Fetch posts from an Instagram profile.
         
@@ -100,6 +147,7 @@ class InstagramScraper:
             username: Instagram username (without @)
             max_posts: Maximum number of posts to fetch
             days_back: Only fetch posts from the last N days (None = no limit)
+            download: Download the post images before returning
             
         Returns:
             List of post dictionaries with caption, image URL, post URL, and timestamp
@@ -117,15 +165,23 @@ class InstagramScraper:
             try:
                 profile = instaloader.Profile.from_username(self.loader.context, username)
                 
+                # Start over on retry so posts from a failed attempt aren't duplicated
+                posts = []
                 post_count = 0
-                for post in profile.get_posts():
-                    if len(posts) >= max_posts:
-                        break
-                    
+                for post in islice(profile.get_posts(), max_posts):
                     # Filter by date if specified
                     if cutoff_date and post.date_utc < cutoff_date:
                         break
                     
+                    # Rate limiting between post fetches - longer delays if not logged in.
+                    # Done before processing so the loop exits without a trailing sleep.
+                    if post_count > 0:
+                        if self.is_logged_in:
+                            delay = 1.5 + random.uniform(0, 0.5)  # 1.5-2 seconds when logged in
+                        else:
+                            delay = 5 + random.uniform(0, 2)  # 5-7 seconds when not logged in
+                        time.sleep(delay)
+                    
                     post_data = {
                         'username': username,
                         'caption': post.caption or '',
@@ -136,41 +192,11 @@ class InstagramScraper:
                         'shortcode': post.shortcode
                     }
                     
-                    # Download image for OCR if it's an image post
-                    if post.typename == 'GraphImage' and not post.is_video:
-                        try:
-                            image_path = f"temp_{post.shortcode}.jpg"
-                            # Add delay before image request
-                            time.sleep(0.5 + random.uniform(0, 0.5))
-                            response = requests.get(post.url, timeout=15)
-                            if response.status_code == 200:
-                                with open(image_path, 'wb') as f:
-                                    f.write(response.content)
-                                post_data['local_image_path'] = image_path
-                            elif response.status_code == 429:
-                                print(f"Rate limited on image download. Waiting {retry_delay * 2} seconds...")
-                                time.sleep(retry_delay * 2)
-                                post_data['local_image_path'] = None
-                            else:
-                                post_data['local_image_path'] = None
-                        except requests.exceptions.RequestException as e:
-                            if '429' in str(e) or 'rate limit' in str(e).lower():
-                                print(f"Rate limited. Waiting {retry_delay * 2} seconds...")
-                                time.sleep(retry_delay * 2)
-                            print(f"Error downloading image for post {post.shortcode}: {e}")
-                            post_data['local_image_path'] = None
-                    else:
-                        post_data['local_image_path'] = None
+                    # Images are downloaded concurrently once the post list is complete
+                    post_data['local_image_path'] = None
                     
                     posts.append(post_data)
                     post_count += 1
-                    
-                    # Rate limiting - longer delays if not logged in
-                    if self.is_logged_in:
-                        delay = 1.5 + random.uniform(0, 0.5)  # 1.5-2 seconds when logged in
-                    else:
-                        delay = 5 + random.uniform(0, 2)  # 5-7 seconds when not logged in
-                    time.sleep(delay)
                 
                 # Success - break out of retry loop
                 break
@@ -213,8 +239,154 @@ class InstagramScraper:
                     print(f"❌ Error fetching posts from @{username}: {e}")
                     break
         
+        if download:
+            self.download_images(posts)
         return posts
     
+    def download_images(self, posts: List[Dict], executor: Optional[ThreadPoolExecutor] = None) -> List[Future]:
+        """
+        Download images for OCR concurrently, filling in each post's 'local_image_path'.
+        
+        Args:
+            posts: Post dictionaries as built by get_profile_posts
+            executor: If given, the downloads are only queued on it and each path is
+                filled in when its download finishes; otherwise this waits for them
+            
+        Returns:
+            Futures for the queued downloads (empty when this waited for them)
+        """
+        image_posts = [post_data for post_data in posts if post_data['image_url'] and not post_data['is_video']]
+        if not image_posts:
+            return []
+        
+        if executor is None:
+            # Image downloads hit the CDN rather than the Instagram API, so a few can run at once
+            with ThreadPoolExecutor(max_workers=self.IMAGE_DOWNLOAD_WORKERS) as executor:
+                self.download_images(image_posts, executor)
+            return []
+        
+        return [executor.submit(self.download_into_post, post_data) for post_data in image_posts]
+    
+    def download_into_post(self, post_data: Dict):
+        """Download a post's image and record where it was saved."""
+        post_data['local_image_path'] = self.download_post_image(post_data)
+    
+    def download_post_image(self, post_data: Dict) -> Optional[str]:
+        """
+        Download a single post image to a temporary file.
+        
+        Args:
+            post_data: Post dictionary with 'image_url' and 'shortcode'
+            
+        Returns:
+            Path to the downloaded image or None if the download failed
+        """
+        image_path = f"temp_{post_data['shortcode']}.jpg"
+        retry_delay = 5
+        
+        # Reuse an image left on disk by an earlier run
+        if os.path.exists(image_path):
+            return image_path
+        
+        try:
+            # Add delay before image request
+            time.sleep(0.5 + random.uniform(0, 0.5))
+            # Stream to disk in chunks instead of buffering the whole image
+            with self.http_session.get(post_data['image_url'], timeout=15, stream=True) as response:
+                if response.status_code == 200:
+                    # Only complete downloads get the final name, so a reused file is never partial
+                    partial_path = image_path + '.part'
+                    try:
+                        with open(partial_path, 'wb') as f:
+                            for chunk in response.iter_content(chunk_size=64 * 1024):
+                                f.write(chunk)
+                        os.replace(partial_path, image_path)
+                    except (requests.exceptions.RequestException, OSError) as e:
+                        # A dropped connection or a full disk leaves the partial file behind
+                        print(f"Error downloading image for post {post_data['shortcode']}: {e}")
+                        try:
+                            os.remove(partial_path)
+                        except OSError:
+                            pass
+                        return None
+                    return image_path
+                elif response.status_code == 429:
+                    print(f"Rate limited on image download. Waiting {retry_delay * 2} seconds...")
+                    time.sleep(retry_delay * 2)
+                return None
+        except requests.exceptions.RequestException as e:
+            if '429' in str(e) or 'rate limit' in str(e).lower():
+                print(f"Rate limited. Waiting {retry_delay * 2} seconds...")
+                time.sleep(retry_delay * 2)
+            print(f"Error downloading image for post {post_data['shortcode']}: {e}")
+            return None
+    
+    def iter_profiles_posts(self, usernames: List[str], max_posts_per_profile: int = 50, days_back: int = None) -> Iterator[List[Dict]]:
+        """
+        Fetch posts profile by profile, yielding each profile's posts once its images are downloaded.
+        
+        Args:
+            usernames: List of Instagram usernames
+            max_posts_per_profile: Maximum posts per profile
+            days_back: Only fetch posts from the last N days (None = no limit)
+            
+        Yields:
+            List of post dictionaries for one profile
+        """
+        # Profiles are still fetched one at a time to stay under Instagram's rate limits,
+        # but each profile's images download during the pause before the next fetch
+        next_fetch_at = 0
+        with ThreadPoolExecutor(max_workers=self.IMAGE_DOWNLOAD_WORKERS) as download_executor:
+            for i, username in enumerate(usernames):
+                posts = self.get_cached_posts(username, max_posts_per_profile, days_back)
+                
+                if posts is None:
+                    # Delay between profiles - longer if not logged in
+                    remaining = next_fetch_at - time.monotonic()
+                    if remaining > 0:
+                        print(f"Waiting {remaining:.1f} seconds before next profile...")
+                        time.sleep(remaining)
+                    
+                    print(f"Fetching posts from @{username}... ({i+1}/{len(usernames)})")
+                    posts = self.get_profile_posts(username, max_posts_per_profile, days_back, download=False)
+                    if posts:
+                        self.post_cache[(username, days_back, max_posts_per_profile)] = (time.monotonic(), posts)
+                    
+                    if self.is_logged_in:
+                        delay = 3 + random.uniform(0, 1)  # 3-4 seconds when logged in
+                    else:
+                        delay = 10 + random.uniform(0, 3)  # 10-13 seconds when not logged in
+                    next_fetch_at = time.monotonic() + delay
+                else:
+                    print(f"Using recently fetched posts from @{username} ({i+1}/{len(usernames)})")
+                
+                downloads = self.download_images(posts, download_executor)
+                wait(downloads)
+                yield posts
+    
+    def get_cached_posts(self, username: str, max_posts: int, days_back: int = None) -> Optional[List[Dict]]:
+        """
+        Get posts fetched for a profile within the last POST_CACHE_TTL seconds.
+        
+        Args:
+            username: Instagram username
+            max_posts: Maximum posts that were requested
+            days_back: Day limit that was requested
+            
+        Returns:
+            Fresh copies of the cached posts, or None if there is no recent fetch
+        """
+        cached = self.post_cache.get((username, days_back, max_posts))
+        if not cached:
+            return None
+        
+        fetched_at, posts = cached
+        if time.monotonic() - fetched_at >= self.POST_CACHE_TTL:
+            return None
+        
+        # Images are cleaned up after each run, so they are downloaded again
+        return [dict(post_data, local_image_path=None) for post_data in posts]
+    
     def get_multiple_profiles_posts(self, usernames: List[str], max_posts_per_profile: int = 50, days_back: int = None) -> List[Dict]:
         """
         Fetch posts from multiple Instagram profiles.
@@ -228,20 +400,9 @@ class InstagramScraper:
             Combined list of all posts from all profiles
         """
         all_posts = []
-        for i, username in enumerate(usernames):
-            print(f"Fetching posts from @{username}... ({i+1}/{len(usernames)})")
-            posts = self.get_profile_posts(username, max_posts_per_profile, days_back)
+        for posts in self.iter_profiles_posts(usernames, max_posts_per_profile, days_back):
             all_posts.extend(posts)
-            
-            # Delay between profiles - longer if not logged in
-            if i < len(usernames) - 1:  # Don't wait after last profile
-                if self.is_logged_in:
-                    delay = 3 + random.uniform(0, 1)  # 3-4 seconds when logged in
-                else:
-                    delay = 10 + random.uniform(0, 3)  # 10-13 seconds when not logged in
-                print(f"Waiting {delay:.1f} seconds before next profile...")
-                time.sleep(delay)
         
         # Sort by timestamp (newest first)
-        all_posts.sort(key=lambda x: x['timestamp'], reverse=True)
+        all_posts.sort(key=itemgetter('timestamp'), reverse=True)
         return all_posts
@@ -7,12 +7,18 @@ import re
 from typing import List, Dict, Optional
 
 
+# Profile URL (instagram.com/<username>) or a bare username
+_USERNAME_RE = re.compile(r'instagram\.com/([^/?]+)|^([a-zA-Z0-9._]+)$')
+
+
 class LinksManager:
     """Manages saved Instagram profile links and nicknames."""
     
     def __init__(self, storage_file: str = 'saved_links.json'):
         self.storage_file = storage_file
         self.links = self.load_links()
+        # Username -> link dict, kept in sync with self.links for O(1) lookups
+        self._by_username = {link['username']: link for link in self.links if link.get('username')}
     
     def extract_username_from_link(self, link: str) -> Optional[str]:
         """
@@ -27,21 +33,19 @@ class LinksManager:
         # Remove @ if present
         link = link.strip().replace('@', '')
         
-        # Extract from URL patterns
-        patterns = [
-            r'instagram\.com/([^/?]+)',
-            r'instagram\.com/([^/?]+)/',
-            r'^([a-zA-Z0-9._]+)$'  # Just username
-        ]
+        # Fast path for a bare username, which is the common case
+        if link.isascii() and link.replace('.', '').replace('_', '').isalnum():
+            return link
         
-        for pattern in patterns:
-            match = re.search(pattern, link)
-            if match:
-                username = match.group(1)
-                # Remove trailing slash or query params
-                username = username.split('/')[0].split('?')[0]
-                if username and username.replace('.', '').replace('_', '').isalnum():
-                    return username
+        match = _USERNAME_RE.search(link)
+        if not match:
+            return None
+        
+        username = match.group(1) or match.group(2)
+        # Remove trailing slash or query params
+        username = username.split('/', 1)[0].split('?', 1)[0]
+        if username and username.replace('.', '').replace('_', '').isalnum():
+            return username
         
         return None
     
@@ -57,12 +61,34 @@ class LinksManager:
     
     def save_links(self):
         """Save links to storage file."""
+        # Write to a temp file and swap it in so a crash never leaves a truncated file
+        tmp_file = self.storage_file + '.tmp'
         try:
-            with open(self.storage_file, 'w', encoding='utf-8') as f:
-                json.dump(self.links, f, indent=2, ensure_ascii=False)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                # Compact output keeps json on its C encoder, which indent would disable
+                json.dump(self.links, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_file, self.storage_file)
         except Exception as e:
             print(f"Error saving links: {e}")
     
+    def export_links(self, path: str) -> bool:
+        """
+        Export saved links as human-readable JSON.
+        
+        Args:
+            path: File to write the export to
+            
+        Returns:
+            True if exported successfully
+        """
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.links, f, indent=2, ensure_ascii=False)
+            return True
+        except Exception as e:
+            print(f"Error exporting links: {e}")
+            return False
+    
     def add_link(self, link: str, nickname: str):
         """
         Add a new link with nickname.
@@ -79,15 +105,16 @@ class LinksManager:
             return False, "Invalid Instagram link or username"
         
         # Check if already exists
-        for saved_link in self.links:
-            if saved_link.get('username') == username:
-                return False, f"Profile @{username} is already saved"
+        if username in self._by_username:
+            return False, f"Profile @{username} is already saved"
         
-        self.links.append({
+        new_link = {
             'username': username,
             'link': link,
             'nickname': nickname.strip() or username
-        })
+        }
+        self.links.append(new_link)
+        self._by_username[username] = new_link
         self.save_links()
         return True, f"Added @{username} as '{nickname}'"
     
@@ -102,12 +129,13 @@ class LinksManager:
         Returns:
             True if updated successfully
         """
-        for link in self.links:
-            if link.get('username') == username:
-                link['nickname'] = nickname.strip() or username
-                self.save_links()
-                return True
-        return False
+        link = self._by_username.get(username)
+        if link is None:
+            return False
+        
+        link['nickname'] = nickname.strip() or username
+        self.save_links()
+        return True
     
     def delete_link(self, username: str) -> bool:
         """
@@ -119,17 +147,29 @@ class LinksManager:
         Returns:
             True if deleted successfully
         """
-        original_count = len(self.links)
+        if self._by_username.pop(username, None) is None:
+            return False
+        
         self.links = [link for link in self.links if link.get('username') != username]
-        if len(self.links) < original_count:
-            self.save_links()
-            return True
-        return False
+        self.save_links()
+        return True
     
     def get_all_usernames(self) -> List[str]:
         """Get list of all saved usernames."""
         return [link.get('username') for link in self.links if link.get('username')]
     
+    def get_link(self, username: str) -> Optional[Dict]:
+        """
+        Get the stored entry for a username.
+        
+        Args:
+            username: Instagram username
+            
+        Returns:
+            The saved link dictionary, or None if the profile isn't saved
+        """
+        return self._by_username.get(username)
+    
     def get_nickname(self, username: str) -> str:
         """
         Get nickname for a username.
@@ -140,10 +180,10 @@ class LinksManager:
         Returns:
             Nickname or username if not found
         """
-        for link in self.links:
-            if link.get('username') == username:
-                return link.get('nickname', username)
-        return username
+        link = self._by_username.get(username)
+        if link is None:
+            return username
+        return link.get('nickname', username)
     
     def get_all_links(self) -> List[Dict]:
         """Get all saved links."""
@@ -3,6 +3,7 @@ Links management UI for adding and managing Instagram profile links.
 """
 import tkinter as tk
 from tkinter import ttk, messagebox
+from tkinter import font as tkfont
 from typing import Callable
 from links_manager import LinksManager
 
@@ -32,21 +33,70 @@ class LinksManagementUI:
             'error': '#d13438'
         }
         
-        # Windows 11 font
+        # Windows 11 font, created once as named Tk fonts so widgets don't re-parse font tuples
         self.font_family = 'Segoe UI'
-        self.font_normal = (self.font_family, 10)
-        self.font_title = (self.font_family, 16, 'normal')
-        self.font_subtitle = (self.font_family, 12, 'normal')
-        self.font_small = (self.font_family, 9)
-        
+        self.font_normal = tkfont.Font(root=self.root, family=self.font_family, size=10)
+        self.font_title = tkfont.Font(root=self.root, family=self.font_family, size=16, weight='normal')
+        self.font_subtitle = tkfont.Font(root=self.root, family=self.font_family, size=12, weight='normal')
+        self.font_small = tkfont.Font(root=self.root, family=self.font_family, size=9)
+        
+        # Saved links as last read from the manager, cleared whenever they change
+        self._links_cache = None
+        self._username_to_index = {}
+        self._index_to_username = []  # Username shown on each listbox row
+        self._display_strings = []  # Text shown on each listbox row
+        self._selected_index = None  # Updated on <<ListboxSelect>>
+        self._refresh_pending = False
+        
+        # Edit dialog, built on first use and hidden rather than destroyed between edits
+        self._edit_dialog = None
+        self._editing_username = None
+        
+        self.setup_styles()
         self.setup_ui()
         self.refresh_links_list()
     
+    def setup_styles(self):
+        """Set up ttk styles so hover and focus colors are handled by Tk, not Python callbacks."""
+        self.style = ttk.Style(self.root)
+        
+        button_colors = {
+            'Primary.TButton': (self.colors['accent'], self.colors['accent_hover']),
+            'Secondary.TButton': (self.colors['secondary_bg'], self.colors['hover']),
+            'Destructive.TButton': (self.colors['error'], '#b02a2e')
+        }
+        for style_name, (bg_color, hover_color) in button_colors.items():
+            self.style.configure(
+                style_name,
+                background=bg_color,
+                foreground=self.colors['fg'],
+                font=self.font_normal,
+                borderwidth=0,
+                relief=tk.FLAT,
+                padding=(20, 8)
+            )
+            self.style.map(
+                style_name,
+                background=[('active', hover_color)],
+                foreground=[('active', self.colors['fg'])]
+            )
+        
+        self.style.configure(
+            'Dark.TEntry',
+            fieldbackground=self.colors['secondary_bg'],
+            foreground=self.colors['fg'],
+            insertcolor=self.colors['fg'],
+            borderwidth=0,
+            padding=(2, 8)
+        )
+        self.style.map('Dark.TEntry', fieldbackground=[('focus', '#333333')])
+    
     def setup_ui(self):
         """Set up the user interface."""
         # Main container with padding
         main_frame = tk.Frame(self.parent, bg=self.colors['bg'])
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        self.main_frame = main_frame
         
         # Title
         title_label = tk.Label(
@@ -85,18 +135,12 @@ class LinksManagementUI:
         )
         link_label.pack(fill=tk.X, pady=(0, 5))
         
-        self.link_entry = tk.Entry(
+        self.link_entry = ttk.Entry(
             link_frame,
-            bg=self.colors['secondary_bg'],
-            fg=self.colors['fg'],
-            insertbackground=self.colors['fg'],
-            font=self.font_normal,
-            relief=tk.FLAT,
-            borderwidth=0
+            style='Dark.TEntry',
+            font=self.font_normal
         )
-        self.link_entry.pack(fill=tk.X, ipady=8)
-        self.link_entry.bind('<FocusIn>', lambda e: self.link_entry.config(bg='#333333'))
-        self.link_entry.bind('<FocusOut>', lambda e: self.link_entry.config(bg=self.colors['secondary_bg']))
+        self.link_entry.pack(fill=tk.X)
         
         # Nickname input
         nickname_frame = tk.Frame(add_frame, bg=self.colors['card_bg'])
@@ -112,18 +156,12 @@ class LinksManagementUI:
         )
         nickname_label.pack(fill=tk.X, pady=(0, 5))
         
-        self.nickname_entry = tk.Entry(
+        self.nickname_entry = ttk.Entry(
             nickname_frame,
-            bg=self.colors['secondary_bg'],
-            fg=self.colors['fg'],
-            insertbackground=self.colors['fg'],
-            font=self.font_normal,
-            relief=tk.FLAT,
-            borderwidth=0
+            style='Dark.TEntry',
+            font=self.font_normal
         )
-        self.nickname_entry.pack(fill=tk.X, ipady=8)
-        self.nickname_entry.bind('<FocusIn>', lambda e: self.nickname_entry.config(bg='#333333'))
-        self.nickname_entry.bind('<FocusOut>', lambda e: self.nickname_entry.config(bg=self.colors['secondary_bg']))
+        self.nickname_entry.pack(fill=tk.X)
         
         # Add button
         button_frame = tk.Frame(add_frame, bg=self.colors['card_bg'])
@@ -180,9 +218,11 @@ class LinksManagementUI:
             font=self.font_normal,
             relief=tk.FLAT,
             borderwidth=0,
+            exportselection=False,  # Keep the selection when text is selected elsewhere
             yscrollcommand=scrollbar.set
         )
         self.links_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.links_listbox.bind('<<ListboxSelect>>', self.on_select)
         scrollbar.config(command=self.links_listbox.yview)
         
         # Action buttons for selected link
@@ -223,50 +263,99 @@ class LinksManagementUI:
         )
         return card
     
-    def create_button(self, parent, text: str, command: Callable, is_primary: bool = False, is_destructive: bool = False) -> tk.Button:
+    def create_button(self, parent, text: str, command: Callable, is_primary: bool = False, is_destructive: bool = False) -> ttk.Button:
         """Create a Windows 11 style button."""
-        bg_color = self.colors['accent'] if is_primary else self.colors['secondary_bg']
-        hover_color = self.colors['accent_hover'] if is_primary else self.colors['hover']
-        
         if is_destructive:
-            bg_color = self.colors['error']
-            hover_color = '#b02a2e'
+            style_name = 'Destructive.TButton'
+        elif is_primary:
+            style_name = 'Primary.TButton'
+        else:
+            style_name = 'Secondary.TButton'
         
-        btn = tk.Button(
+        return ttk.Button(
             parent,
             text=text,
             command=command,
-            bg=bg_color,
-            fg=self.colors['fg'],
-            activebackground=hover_color,
-            activeforeground=self.colors['fg'],
-            borderwidth=0,
-            font=self.font_normal,
-            relief=tk.FLAT,
-            cursor='hand2',
-            padx=20,
-            pady=8
+            style=style_name,
+            cursor='hand2'
         )
-        
-        # Add hover effect
-        def on_enter(e):
-            btn.config(bg=hover_color)
-        
-        def on_leave(e):
-            btn.config(bg=bg_color)
-        
-        btn.bind('<Enter>', on_enter)
-        btn.bind('<Leave>', on_leave)
-        
-        return btn
+    
+    def schedule_refresh(self):
+        """Refresh the links list once Tk is idle, coalescing repeated requests."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.root.after_idle(self._do_refresh)
+    
+    def _do_refresh(self):
+        """Run a refresh scheduled by schedule_refresh."""
+        self._refresh_pending = False
+        # The view may have been torn down before the idle callback ran
+        if self.links_listbox.winfo_exists():
+            self.refresh_links_list()
     
     def refresh_links_list(self):
         """Refresh the links listbox."""
+        self.invalidate_links()
         self.links_listbox.delete(0, tk.END)
-        links = self.links_manager.get_all_links()
-        for link in links:
-            display_text = f"{link.get('nickname', link.get('username'))} (@{link.get('username')})"
-            self.links_listbox.insert(tk.END, display_text)
+        self._selected_index = None
+        self.get_links()
+        # One Tcl call for all rows instead of one per row
+        if self._display_strings:
+            self.links_listbox.insert(tk.END, *self._display_strings)
+    
+    def format_link(self, link: dict) -> str:
+        """Format a saved link for its listbox row."""
+        return f"{link.get('nickname', link.get('username'))} (@{link.get('username')})"
+    
+    def _append_row(self, link: dict):
+        """Add a row for a newly saved link without rebuilding the list."""
+        links = self.get_links()
+        self._username_to_index[link.get('username')] = len(links)
+        links.append(link)
+        self._index_to_username.append(link.get('username'))
+        self._display_strings.append(self.format_link(link))
+        self.links_listbox.insert(tk.END, self._display_strings[-1])
+    
+    def _update_row(self, index: int):
+        """Redraw a single row after its link was edited."""
+        self._display_strings[index] = self.format_link(self.get_links()[index])
+        self.links_listbox.delete(index)
+        self.links_listbox.insert(index, self._display_strings[index])
+        if self._selected_index == index:
+            self.links_listbox.selection_set(index)
+    
+    def _remove_row(self, index: int):
+        """Remove a single row and shift the indices of the rows after it."""
+        links = self.get_links()
+        del links[index]
+        del self._display_strings[index]
+        username = self._index_to_username.pop(index)
+        self._username_to_index.pop(username, None)
+        for i in range(index, len(self._index_to_username)):
+            self._username_to_index[self._index_to_username[i]] = i
+        self.links_listbox.delete(index)
+        
+        if self._selected_index == index:
+            self._selected_index = None
+        elif self._selected_index is not None and self._selected_index > index:
+            self._selected_index -= 1
+    
+    def get_links(self) -> list:
+        """Get the saved links, only asking the manager again after a change."""
+        if self._links_cache is None:
+            self._links_cache = self.links_manager.get_all_links()
+            self._username_to_index = {link.get('username'): i for i, link in enumerate(self._links_cache)}
+            self._index_to_username = [link.get('username') for link in self._links_cache]
+            self._display_strings = [self.format_link(link) for link in self._links_cache]
+        return self._links_cache
+    
+    def invalidate_links(self):
+        """Drop the cached links so the next get_links call rereads them."""
+        self._links_cache = None
+        self._username_to_index = {}
+        self._index_to_username = []
+        self._display_strings = []
     
     def add_link(self):
         """Add a new link."""
@@ -277,27 +366,39 @@ class LinksManagementUI:
             messagebox.showerror("Error", "Please enter an Instagram link or username.")
             return
         
+        # Catch duplicates against the cached list before going through the manager
+        username = self.links_manager.extract_username_from_link(link)
+        self.get_links()
+        if username and username in self._username_to_index:
+            messagebox.showerror("Error", f"Profile @{username} is already saved")
+            return
+        
         success, message = self.links_manager.add_link(link, nickname)
         
         if success:
+            # Show the entry as the manager stored it
+            new_link = self.links_manager.get_link(username)
+            if new_link is not None and username not in self._username_to_index:
+                self._append_row(new_link)
+            else:
+                self.schedule_refresh()
             self.link_entry.delete(0, tk.END)
             self.nickname_entry.delete(0, tk.END)
-            self.refresh_links_list()
             messagebox.showinfo("Success", message)
         else:
             messagebox.showerror("Error", message)
     
     def get_selected_username(self) -> str:
         """Get username from selected listbox item."""
-        selection = self.links_listbox.curselection()
-        if not selection:
+        index = self._selected_index
+        if index is None or index >= len(self._index_to_username):
             return None
-        
-        index = selection[0]
-        links = self.links_manager.get_all_links()
-        if index < len(links):
-            return links[index].get('username')
-        return None
+        return self._index_to_username[index]
+    
+    def on_select(self, event):
+        """Remember the selected row so actions don't have to query the listbox."""
+        selection = self.links_listbox.curselection()
+        self._selected_index = selection[0] if selection else None
     
     def fetch_selected(self):
         """Fetch shows for selected profile."""
@@ -316,71 +417,99 @@ class LinksManagementUI:
             messagebox.showwarning("No Selection", "Please select a profile to edit.")
             return
         
-        links = self.links_manager.get_all_links()
-        current_link = next((l for l in links if l.get('username') == username), None)
-        if not current_link:
+        links = self.get_links()
+        index = self._username_to_index.get(username)
+        if index is None:
             return
+        current_link = links[index]
         
         current_nickname = current_link.get('nickname', username)
         
-        # Simple dialog
-        dialog = tk.Toplevel(self.root)
+        self._editing_username = username
+        dialog = self.get_edit_dialog()
+        self._edit_label.config(text=f"Edit nickname for @{username}:")
+        self._edit_entry.delete(0, tk.END)
+        self._edit_entry.insert(0, current_nickname)
+        self._edit_entry.select_range(0, tk.END)
+        
+        dialog.deiconify()
+        dialog.grab_set()
+        self._edit_entry.focus()
+    
+    def get_edit_dialog(self) -> tk.Toplevel:
+        """Get the edit nickname dialog, building it (hidden) on first use."""
+        if self._edit_dialog is not None:
+            return self._edit_dialog
+        
+        # Parented to this view so it goes away when the view is destroyed
+        dialog = tk.Toplevel(self.main_frame)
+        dialog.withdraw()
         dialog.title("Edit Nickname")
         dialog.configure(bg=self.colors['bg'])
-        dialog.geometry('400x150')
         dialog.transient(self.root)
-        dialog.grab_set()
+        dialog.protocol('WM_DELETE_WINDOW', self.hide_edit_dialog)
         
         # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f"+{x}+{y}")
+        x = (dialog.winfo_screenwidth() - 400) // 2
+        y = (dialog.winfo_screenheight() - 150) // 2
+        dialog.geometry(f"400x150+{x}+{y}")
         
-        label = tk.Label(
+        self._edit_label = tk.Label(
             dialog,
-            text=f"Edit nickname for @{username}:",
+            text='',
             bg=self.colors['bg'],
             fg=self.colors['fg'],
             font=self.font_normal
         )
-        label.pack(pady=20)
+        self._edit_label.pack(pady=20)
         
-        entry = tk.Entry(
+        self._edit_entry = ttk.Entry(
             dialog,
-            bg=self.colors['secondary_bg'],
-            fg=self.colors['fg'],
-            insertbackground=self.colors['fg'],
-            font=self.font_normal,
-            relief=tk.FLAT
+            style='Dark.TEntry',
+            font=self.font_normal
         )
-        entry.insert(0, current_nickname)
-        entry.pack(fill=tk.X, padx=20, ipady=8)
-        entry.focus()
-        entry.select_range(0, tk.END)
+        self._edit_entry.pack(fill=tk.X, padx=20)
         
         def save():
-            new_nickname = entry.get().strip()
+            username = self._editing_username
+            new_nickname = self._edit_entry.get().strip()
             if self.links_manager.update_link(username, new_nickname):
-                self.refresh_links_list()
-                dialog.destroy()
+                # The cached link is the manager's own dict, so only the row text is stale
+                if username in self._username_to_index:
+                    self._update_row(self._username_to_index[username])
+                else:
+                    # The list no longer matches the manager; rebuild it instead
+                    self.schedule_refresh()
+                self.hide_edit_dialog()
                 messagebox.showinfo("Success", f"Nickname updated to '{new_nickname}'")
             else:
                 messagebox.showerror("Error", "Failed to update nickname.")
         
-        def cancel():
-            dialog.destroy()
-        
         button_frame = tk.Frame(dialog, bg=self.colors['bg'])
         button_frame.pack(pady=20)
         
         save_btn = self.create_button(button_frame, "Save", save, is_primary=True)
         save_btn.pack(side=tk.LEFT, padx=5)
         
-        cancel_btn = self.create_button(button_frame, "Cancel", cancel, is_primary=False)
+        cancel_btn = self.create_button(button_frame, "Cancel", self.hide_edit_dialog, is_primary=False)
         cancel_btn.pack(side=tk.LEFT, padx=5)
         
-        entry.bind('<Return>', lambda e: save())
+        self._edit_entry.bind('<Return>', lambda e: save())
+        
+        def on_destroy(e):
+            if e.widget is dialog:
+                self._edit_dialog = None
+        
+        dialog.bind('<Destroy>', on_destroy)
+        
+        self._edit_dialog = dialog
+        return dialog
+    
+    def hide_edit_dialog(self):
+        """Hide the edit nickname dialog so it can be reused for the next edit."""
+        if self._edit_dialog is not None:
+            self._edit_dialog.grab_release()
+            self._edit_dialog.withdraw()
     
     def delete_selected(self):
         """Delete selected profile."""
@@ -396,14 +525,17 @@ class LinksManagementUI:
         
         if result:
             if self.links_manager.delete_link(username):
-                self.refresh_links_list()
+                if username in self._username_to_index:
+                    self._remove_row(self._username_to_index[username])
+                else:
+                    self.schedule_refresh()
                 messagebox.showinfo("Success", f"Removed @{username}")
             else:
                 messagebox.showerror("Error", "Failed to delete profile.")
     
     def refetch_all(self):
         """Refetch shows from all saved profiles."""
-        links = self.links_manager.get_all_links()
+        links = self.get_links()
         if not links:
             messagebox.showwarning("No Profiles", "No saved profiles to fetch from.")
             return
@@ -2,9 +2,9 @@
 Main application file for Show Finder.
 """
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, ttk
 from show_processor import ShowProcessor
-from calendar_ui import CalendarUI
+from calendar_ui import CalendarUI, bind_hover_buttons
 from links_ui import LinksManagementUI
 from links_manager import LinksManager
 import threading
@@ -26,6 +26,12 @@ class ShowFinderApp:
         self.instagram_username = None
         self.instagram_password = None
         
+        # App-wide ttk theme, set once; the views only configure their own named styles
+        ttk.Style(self.root).theme_use('clam')
+        
+        # One class-level binding drives hover for every navigation button
+        bind_hover_buttons(self.root)
+        
         # Create navigation bar
         self.nav_frame = tk.Frame(self.root, bg='#2a2a2a', height=50)
         self.nav_frame.pack(fill=tk.X, padx=0, pady=0)
@@ -36,9 +42,17 @@ class ShowFinderApp:
         self.main_container = tk.Frame(self.root, bg='#202020')
         self.main_container.pack(fill=tk.BOTH, expand=True)
         
-        # Initialize views
-        self.calendar_ui = None
-        self.links_ui = None
+        # Build both views once; switching views only packs/unpacks their frames
+        self.calendar_frame = tk.Frame(self.main_container, bg='#202020')
+        self.calendar_ui = CalendarUI(self.calendar_frame)
+        
+        self.links_frame = tk.Frame(self.main_container, bg='#202020')
+        self.links_ui = LinksManagementUI(
+            self.links_frame,
+            self.links_manager,
+            on_fetch_callback=self.fetch_shows_from_usernames,
+            on_refetch_all_callback=self.refetch_all_shows
+        )
         self.current_view = 'calendar'
         
         # Start with calendar view
@@ -96,6 +110,36 @@ class ShowFinderApp:
             font=(self.font_family, 12, 'bold')
         )
         title_label.pack(side=tk.RIGHT)
+        
+        # Fetch indicator, packed only while a fetch is running
+        self.fetch_in_progress = False
+        self.fetch_status_frame = tk.Frame(right_frame, bg='#2a2a2a')
+        
+        self.fetch_status_label = tk.Label(
+            self.fetch_status_frame,
+            text="",
+            bg='#2a2a2a',
+            fg='#a0a0a0',
+            font=(self.font_family, 9)
+        )
+        self.fetch_status_label.pack(side=tk.LEFT, padx=(0, 8))
+        
+        style = ttk.Style(self.root)
+        style.configure(
+            'Nav.Horizontal.TProgressbar',
+            troughcolor='#3a3a3a',
+            background='#0078d4',
+            bordercolor='#2a2a2a',
+            lightcolor='#0078d4',
+            darkcolor='#0078d4'
+        )
+        self.fetch_progress = ttk.Progressbar(
+            self.fetch_status_frame,
+            mode='indeterminate',
+            length=120,
+            style='Nav.Horizontal.TProgressbar'
+        )
+        self.fetch_progress.pack(side=tk.LEFT)
     
     def create_nav_button(self, parent, text, command, is_active=False):
         """Create a navigation button."""
@@ -119,16 +163,10 @@ class ShowFinderApp:
             pady=8
         )
         
-        def on_enter(e):
-            if not is_active:
-                btn.config(bg=hover_color)
-        
-        def on_leave(e):
-            if not is_active:
-                btn.config(bg=bg_color)
-        
-        btn.bind('<Enter>', on_enter)
-        btn.bind('<Leave>', on_leave)
+        # Hover colors are applied by the shared 'HoverButton' class binding
+        btn.normal_bg = bg_color
+        btn.hover_bg = bg_color if is_active else hover_color
+        btn.bindtags(('HoverButton',) + btn.bindtags())
         
         return btn
     
@@ -144,38 +182,34 @@ class ShowFinderApp:
         )
         self.root.config(menu=menubar)
         
-        settings_menu = tk.Menu(menubar, tearoff=0, bg='#2a2a2a', fg='#ffffff', activebackground='#0078d4')
-        menubar.add_cascade(label="Settings", menu=settings_menu)
-        settings_menu.add_command(label="Instagram Login...", command=self.show_login_dialog)
-        settings_menu.add_command(label="Logout", command=self.logout_instagram)
+        # Login and logout replace the scraper's session, so they are disabled while a fetch runs
+        self.settings_menu = tk.Menu(menubar, tearoff=0, bg='#2a2a2a', fg='#ffffff', activebackground='#0078d4')
+        menubar.add_cascade(label="Settings", menu=self.settings_menu)
+        self.settings_menu.add_command(label="Instagram Login...", command=self.show_login_dialog)
+        self.settings_menu.add_command(label="Logout", command=self.logout_instagram)
         
         help_menu = tk.Menu(menubar, tearoff=0, bg='#2a2a2a', fg='#ffffff', activebackground='#0078d4')
         menubar.add_cascade(label="Help", menu=help_menu)
         help_menu.add_command(label="About", command=self.show_about)
     
-    def clear_main_container(self):
-        """Clear the main container."""
-        for widget in self.main_container.winfo_children():
-            widget.destroy()
+    def set_account_menu_state(self, state: str):
+        """Enable or disable the login and logout menu entries."""
+        self.settings_menu.entryconfig("Instagram Login...", state=state)
+        self.settings_menu.entryconfig("Logout", state=state)
     
     def show_calendar_view(self):
         """Show the calendar view."""
         self.current_view = 'calendar'
-        self.clear_main_container()
-        self.calendar_ui = CalendarUI(self.main_container)
+        self.links_frame.pack_forget()
+        self.calendar_frame.pack(fill=tk.BOTH, expand=True)
         self.root.title("Show Finder - Calendar")
         self.update_nav_buttons()
     
     def show_links_view(self):
         """Show the links management view."""
         self.current_view = 'profiles'
-        self.clear_main_container()
-        self.links_ui = LinksManagementUI(
-            self.main_container,
-            self.links_manager,
-            on_fetch_callback=self.fetch_shows_from_usernames,
-            on_refetch_all_callback=self.refetch_all_shows
-        )
+        self.calendar_frame.pack_forget()
+        self.links_frame.pack(fill=tk.BOTH, expand=True)
         self.root.title("Show Finder - Manage Profiles")
         self.update_nav_buttons()
     
@@ -190,11 +224,15 @@ class ShowFinderApp:
             bg='#0078d4' if is_calendar else '#2a2a2a',
             activebackground='#106ebe' if is_calendar else '#3a3a3a'
         )
+        self.calendar_btn.normal_bg = '#0078d4' if is_calendar else '#2a2a2a'
+        self.calendar_btn.hover_bg = '#0078d4' if is_calendar else '#3a3a3a'
         
         self.profiles_btn.config(
             bg='#0078d4' if not is_calendar else '#2a2a2a',
             activebackground='#106ebe' if not is_calendar else '#3a3a3a'
         )
+        self.profiles_btn.normal_bg = '#0078d4' if not is_calendar else '#2a2a2a'
+        self.profiles_btn.hover_bg = '#0078d4' if not is_calendar else '#3a3a3a'
     
     def update_login_status(self):
         """Update login status indicator."""
@@ -233,33 +271,22 @@ class ShowFinderApp:
     
     def _fetch_and_display_shows(self, usernames: list, nickname_map: dict, days_back: int = 7, max_posts: int = 20):
         """Internal method to fetch and display shows."""
-        # Show loading message
-        loading_window = tk.Toplevel(self.root)
-        loading_window.title("Loading Shows")
-        loading_window.configure(bg='#202020')
-        loading_window.geometry('350x120')
-        loading_window.transient(self.root)
-        loading_window.grab_set()
-        
-        # Center the loading window
-        loading_window.update_idletasks()
-        x = (loading_window.winfo_screenwidth() // 2) - (loading_window.winfo_width() // 2)
-        y = (loading_window.winfo_screenheight() // 2) - (loading_window.winfo_height() // 2)
-        loading_window.geometry(f"+{x}+{y}")
-        
-        status_label = tk.Label(
-            loading_window,
-            text=f"Fetching posts from {len(usernames)} profile(s)...\nThis may take a while.",
-            bg='#202020',
-            fg='#ffffff',
-            font=(self.font_family, 10)
-        )
-        status_label.pack(expand=True, pady=20)
+        # The nav bar indicator replaces the modal, so ignore clicks while a fetch runs
+        if self.fetch_in_progress:
+            return
+        self.fetch_in_progress = True
+        self.set_account_menu_state(tk.DISABLED)
+        
+        # Show loading indicator
+        self.fetch_status_label.config(text=f"Fetching posts from {len(usernames)} profile(s)...")
+        self.fetch_status_frame.pack(side=tk.RIGHT, padx=(0, 15))
+        self.fetch_progress.start(15)
         
         def process_in_thread():
+            is_logged_in = self.processor.scraper.is_logged_in
             try:
                 # Warn if not logged in
-                if not self.processor.scraper.is_logged_in:
+                if not is_logged_in:
                     print("⚠️ Warning: Not logged in. Rate limiting may occur. Consider logging in via Settings → Instagram Login...")
                 
                 shows = self.processor.process_posts(
@@ -268,44 +295,45 @@ class ShowFinderApp:
                     days_back=days_back,
                     nickname_map=nickname_map
                 )
-                loading_window.destroy()
-                
-                if shows:
-                    # Switch to calendar view to show results
-                    self.show_calendar_view()
-                    self.calendar_ui.set_shows(shows)
-                    
-                    messagebox.showinfo(
-                        "Success",
-                        f"Loaded {len(shows)} shows from {len(usernames)} profile(s)."
-                    )
-                else:
-                    warning_msg = "No shows were found in the posts from the provided profiles.\n\n"
-                    warning_msg += "Make sure the posts are from the past week and contain show-related keywords."
-                    if not self.processor.scraper.is_logged_in:
-                        warning_msg += "\n\nTip: Logging in (Settings → Instagram Login) can help avoid rate limiting."
-                    messagebox.showwarning("No Shows Found", warning_msg)
+                error = None
             except Exception as e:
-                loading_window.destroy()
-                error_msg = f"An error occurred while loading shows:\n{str(e)}"
-                if not self.processor.scraper.is_logged_in and '429' in str(e):
-                    error_msg += "\n\nTip: Logging in (Settings → Instagram Login) can help avoid rate limiting."
-                messagebox.showerror("Error", error_msg)
+                shows = None
+                error = e
+            
+            # Hand the result back to the Tk thread; it is the only thread that touches widgets
+            self.root.after(0, lambda: self._on_fetch_done(shows, error, len(usernames), is_logged_in))
         
         # Process in a separate thread to avoid freezing the UI
         thread = threading.Thread(target=process_in_thread, daemon=True)
         thread.start()
-        
-        # Update the loading window periodically
-        self.root.after(100, lambda: self.check_thread(thread, loading_window))
     
-    def check_thread(self, thread, window):
-        """Check if thread is still running."""
-        if thread.is_alive():
-            self.root.after(100, lambda: self.check_thread(thread, window))
+    def _on_fetch_done(self, shows, error, profile_count: int, is_logged_in: bool):
+        """Display the result of a fetch once its worker thread has finished."""
+        self.fetch_progress.stop()
+        self.fetch_status_frame.pack_forget()
+        self.fetch_in_progress = False
+        self.set_account_menu_state(tk.NORMAL)
+        
+        if error is not None:
+            error_msg = f"An error occurred while loading shows:\n{str(error)}"
+            if not is_logged_in and '429' in str(error):
+                error_msg += "\n\nTip: Logging in (Settings → Instagram Login) can help avoid rate limiting."
+            messagebox.showerror("Error", error_msg)
+        elif shows:
+            # Switch to calendar view to show results
+            self.show_calendar_view()
+            self.calendar_ui.set_shows(shows)
+            
+            messagebox.showinfo(
+                "Success",
+                f"Loaded {len(shows)} shows from {profile_count} profile(s)."
+            )
         else:
-            if window.winfo_exists():
-                window.destroy()
+            warning_msg = "No shows were found in the posts from the provided profiles.\n\n"
+            warning_msg += "Make sure the posts are from the past week and contain show-related keywords."
+            if not is_logged_in:
+                warning_msg += "\n\nTip: Logging in (Settings → Instagram Login) can help avoid rate limiting."
+            messagebox.showwarning("No Shows Found", warning_msg)
     
     def show_login_dialog(self):
         """Show Instagram login dialog."""
@@ -405,6 +433,11 @@ class ShowFinderApp:
                 messagebox.showerror("Error", "Please enter both username and password.")
                 return
             
+            # The dialog may have been opened before a fetch started
+            if self.fetch_in_progress:
+                messagebox.showwarning("Fetch In Progress", "Please wait for the current fetch to finish before logging in.")
+                return
+            
             # Try to login
             if self.processor.scraper.login(username, password):
                 self.instagram_username = username
@@ -455,6 +488,9 @@ class ShowFinderApp:
     
     def logout_instagram(self):
         """Logout from Instagram."""
+        if self.fetch_in_progress:
+            messagebox.showwarning("Fetch In Progress", "Please wait for the current fetch to finish before logging out.")
+            return
         if self.processor.scraper.is_logged_in:
             self.processor.scraper.logout()
             self.instagram_username = None
@@ -3,34 +3,71 @@ OCR module to extract text from post images.
 """
 import pytesseract
 from PIL import Image
-from typing import Optional, Dict
+from typing import Optional, Dict, List
+from text_parser import ShowTextParser
+import hashlib
 import os
+import subprocess
+import tempfile
 
 
 class OCRExtractor:
     """Extracts text from images using OCR."""
     
+    # Tesseract discovery is shared by every instance and only done once
+    _tesseract_cmd: Optional[str] = None
+    _tesseract_available: Optional[bool] = None
+    
+    # LSTM engine only, and treat the image as a single block of text
+    TESSERACT_CONFIG = '--oem 1 --psm 6'
+    
+    # Largest dimension passed to tesseract; poster text stays legible at this size
+    MAX_OCR_SIZE = (1200, 1200)
+    
+    # OCR output is cached on disk, keyed by a hash of the image bytes
+    MAX_CACHE_ENTRIES = 5000
+    
     def __init__(self):
+        self.tesseract_available = self.detect_tesseract()
+        self._parser = ShowTextParser()
+        self.cache_dir = 'ocr_cache'
+        self.prune_cache()
+    
+    @classmethod
+    def detect_tesseract(cls) -> bool:
+        """
+        Locate the tesseract executable, caching the result on the class.
+        
+        Returns:
+            True if tesseract can be used, False otherwise
+        """
+        if cls._tesseract_available is not None:
+            return cls._tesseract_available
+        
         # Try to find tesseract executable (common Windows paths)
         # User may need to set this manually if tesseract is installed elsewhere
-        self.tesseract_available = False
+        cls._tesseract_available = False
         try:
             # Common Windows installation path
             if os.path.exists(r'C:\Program Files\Tesseract-OCR\tesseract.exe'):
-                pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
-                self.tesseract_available = True
+                cls._tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+                pytesseract.pytesseract.tesseract_cmd = cls._tesseract_cmd
+                cls._tesseract_available = True
             elif os.path.exists(r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe'):
-                pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe'
-                self.tesseract_available = True
+                cls._tesseract_cmd = r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe'
+                pytesseract.pytesseract.tesseract_cmd = cls._tesseract_cmd
+                cls._tesseract_available = True
             else:
                 # Try to use tesseract from PATH
                 try:
                     pytesseract.get_tesseract_version()
-                    self.tesseract_available = True
+                    cls._tesseract_available = True
                 except:
-                    self.tesseract_available = False
+                    cls._tesseract_available = False
         except:
-            self.tesseract_available = False
+            cls._tesseract_available = False
+        
+        return cls._tesseract_available
     
     def extract_text_from_image(self, image_path: str) -> Optional[str]:
         """
@@ -48,23 +85,203 @@ class OCRExtractor:
         if not image_path or not os.path.exists(image_path):
             return None
         
+        cache_key = self.get_cache_key(image_path)
+        cached = self.read_cache(cache_key)
+        if cached is not None:
+            return cached or None
+        
         try:
-            image = Image.open(image_path)
-            
-            # Preprocess image for better OCR results
-            # Convert to RGB if necessary
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
+            image = self.prepare_image(image_path)
             
             # Use OCR to extract text
-            text = pytesseract.image_to_string(image)
+            text = pytesseract.image_to_string(image, config=self.TESSERACT_CONFIG)
+            text = text.strip() if text else ''
+            self.write_cache(cache_key, text)
             
-            return text.strip() if text else None
+            return text or None
             
         except Exception as e:
             print(f"Error extracting text from image {image_path}: {e}")
             return None
     
+    def prepare_image(self, image_path: str) -> Image.Image:
+        """
+        Load an image the way it is handed to tesseract.
+        
+        Args:
+            image_path: Path to the image file
+            
+        Returns:
+            Grayscale image no larger than MAX_OCR_SIZE
+        """
+        image = Image.open(image_path)
+        # Let libjpeg decode straight to grayscale at a reduced scale (no-op for other formats)
+        image.draft('L', self.MAX_OCR_SIZE)
+        
+        # Preprocess image for faster OCR: shrink it and drop the colour channels
+        image.thumbnail(self.MAX_OCR_SIZE, Image.LANCZOS)
+        if image.mode != 'L':
+            image = image.convert('L')
+        return image
+    
+    def extract_text_from_images(self, image_paths: List[str]) -> List[Optional[str]]:
+        """
+        Extract text from several images with a single tesseract invocation.
+        
+        Tesseract accepts a text file listing image paths and writes each page
+        followed by a form feed, so the startup and model load are paid once
+        per batch instead of once per image. The listed files are preprocessed
+        copies, so both paths OCR (and cache) the same pixels.
+        
+        Args:
+            image_paths: Paths to the image files
+            
+        Returns:
+            Extracted text (or None) for each path, in the same order
+        """
+        results = [None] * len(image_paths)
+        
+        if not self.tesseract_available:
+            return results
+        
+        indices = []
+        cache_keys = {}
+        for i, path in enumerate(image_paths):
+            if not path or not os.path.exists(path):
+                continue
+            cache_keys[i] = self.get_cache_key(path)
+            cached = self.read_cache(cache_keys[i])
+            if cached is not None:
+                results[i] = cached or None
+            else:
+                indices.append(i)
+        
+        if not indices:
+            return results
+        
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                prepared_paths = []
+                for i in indices:
+                    prepared_path = os.path.join(temp_dir, f'{i}.png')
+                    self.prepare_image(image_paths[i]).save(prepared_path, compress_level=1)
+                    prepared_paths.append(prepared_path)
+                
+                list_path = os.path.join(temp_dir, 'images.txt')
+                with open(list_path, 'w', encoding='utf-8') as list_file:
+                    list_file.write('\n'.join(prepared_paths))
+                
+                completed = subprocess.run(
+                    [pytesseract.pytesseract.tesseract_cmd, list_path, 'stdout'] + self.TESSERACT_CONFIG.split(),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    env=dict(os.environ, OMP_THREAD_LIMIT='1'),
+                    check=True
+                )
+            
+            # Every page ends with a form feed, so the split leaves an empty tail
+            pages = completed.stdout.decode('utf-8', errors='replace').split('\x0c')
+            if pages.pop().strip():
+                raise RuntimeError("output does not end with a page separator")
+            
+            # A page that failed to load would shift every result after it
+            if len(pages) != len(indices):
+                raise RuntimeError(f"expected {len(indices)} pages, got {len(pages)}")
+            
+            for i, text in zip(indices, pages):
+                text = text.strip()
+                self.write_cache(cache_keys[i], text)
+                results[i] = text or None
+            
+        except Exception as e:
+            print(f"Error running batch OCR, falling back to one image at a time: {e}")
+            for i in indices:
+                results[i] = self.extract_text_from_image(image_paths[i])
+        
+        return results
+    
+    def get_cache_key(self, image_path: str) -> Optional[str]:
+        """
+        Hash an image's contents (and the OCR and preprocessing settings) into a cache key.
+        
+        Args:
+            image_path: Path to the image file
+            
+        Returns:
+            Hex digest, or None if the file can't be read
+        """
+        try:
+            digest = hashlib.sha1(f'{self.TESSERACT_CONFIG} {self.MAX_OCR_SIZE} L'.encode())
+            with open(image_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(65536), b''):
+                    digest.update(chunk)
+            return digest.hexdigest()
+        except OSError:
+            return None
+    
+    def read_cache(self, cache_key: Optional[str]) -> Optional[str]:
+        """
+        Look up cached OCR text.
+        
+        Args:
+            cache_key: Key from get_cache_key
+            
+        Returns:
+            Cached text ('' if the image had none), or None on a cache miss
+        """
+        if not cache_key:
+            return None
+        
+        cache_path = os.path.join(self.cache_dir, f'{cache_key}.txt')
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            # Touch the entry so pruning drops the least recently used ones
+            os.utime(cache_path)
+            return text
+        except OSError:
+            return None
+    
+    def write_cache(self, cache_key: Optional[str], text: str):
+        """Store OCR text for an image in the cache."""
+        if not cache_key:
+            return
+        
+        # Write to a unique temp file and swap it in, so a crash or a second writer
+        # for the same key never leaves a truncated entry behind
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=self.cache_dir)
+            with open(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, os.path.join(self.cache_dir, f'{cache_key}.txt'))
+        except OSError as e:
+            print(f"Error writing OCR cache: {e}")
+            if tmp_path:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+    
+    def prune_cache(self):
+        """Remove the least recently used cache entries beyond MAX_CACHE_ENTRIES."""
+        try:
+            with os.scandir(self.cache_dir) as it:
+                entries = [entry for entry in it if entry.name.endswith('.txt')]
+        except OSError:
+            return
+        
+        if len(entries) <= self.MAX_CACHE_ENTRIES:
+            return
+        
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - self.MAX_CACHE_ENTRIES]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+    
     def extract_show_info_from_image(self, image_path: str, post_timestamp) -> Dict[str, Optional[str]]:
         """
         Extract show information from image text.
@@ -76,21 +293,50 @@ class OCRExtractor:
         Returns:
             Dictionary with extracted date, location, and time
         """
-        from text_parser import ShowTextParser
+        extracted_text = self.extract_text_from_image(image_path)
+        
+        return self.parse_show_info_from_text(extracted_text, post_timestamp)
+    
+    def extract_show_info_from_images(self, image_paths: List[str], post_timestamps: List) -> List[Dict[str, Optional[str]]]:
+        """
+        Extract show information from several images using one batched OCR run.
+        
+        Args:
+            image_paths: Paths to the image files
+            post_timestamps: When each post was made (for date context)
+            
+        Returns:
+            List of dictionaries with extracted date, location, and time
+        """
+        texts = self.extract_text_from_images(image_paths)
         
+        return [
+            self.parse_show_info_from_text(text, timestamp)
+            for text, timestamp in zip(texts, post_timestamps)
+        ]
+    
+    def parse_show_info_from_text(self, extracted_text: Optional[str], post_timestamp) -> Dict[str, Optional[str]]:
+        """
+        Parse show information out of OCR text.
+        
+        Args:
+            extracted_text: Text read from the image
+            post_timestamp: When the post was made (for date context)
+            
+        Returns:
+            Dictionary with extracted date, location, and time
+        """
         info = {
             'date': None,
             'location': None,
             'time': None
         }
         
-        extracted_text = self.extract_text_from_image(image_path)
-        
         if not extracted_text:
             return info
         
         # Use the text parser to extract info from OCR text
-        parser = ShowTextParser()
+        parser = self._parser
         
         parsed_date = parser.extract_date(extracted_text, post_timestamp)
         if parsed_date:
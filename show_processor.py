@@ -6,20 +6,48 @@ from datetime import datetime
 from instagram_scraper import InstagramScraper
 from text_parser import ShowTextParser
 from ocr_extractor import OCRExtractor
+from concurrent.futures import ThreadPoolExecutor
 import os
+import queue
+import re
+import threading
+
+
+# A show post always contains at least one show keyword or event word, so captions
+# without any of them can be rejected in one pass before the full parser runs
+_SHOW_HINT_RE = re.compile(
+    '|'.join(re.escape(word) for word in ShowTextParser.SHOW_KEYWORDS + ShowTextParser.EVENT_WORDS),
+    re.IGNORECASE
+)
+
+
+def remove_files(paths: List[str]):
+    """Delete files, ignoring any that are already gone."""
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
 
 
 class ShowProcessor:
     """Processes Instagram posts to extract show information."""
     
+    # Concurrent tesseract batches; each run is limited to one OpenMP thread, so
+    # a few processes use the cores without oversubscribing them
+    OCR_WORKERS = min(4, os.cpu_count() or 1)
+    
+    # Images smaller than this (bytes) are thumbnails unlikely to hold legible text
+    MIN_OCR_IMAGE_BYTES = 15_000
+    
     def __init__(self, instagram_username: Optional[str] = None, instagram_password: Optional[str] = None):
         self.scraper = InstagramScraper(instagram_username, instagram_password)
         self.text_parser = ShowTextParser()
         self.ocr_extractor = OCRExtractor()
     
     def update_credentials(self, username: Optional[str] = None, password: Optional[str] = None):
-        """Update Instagram credentials and reinitialize scraper."""
-        self.scraper = InstagramScraper(username, password)
+        """Update Instagram credentials, keeping the scraper's download session."""
+        self.scraper.relogin(username, password)
     
     def process_posts(self, usernames: List[str], max_posts_per_profile: int = 50, days_back: int = None, nickname_map: Dict[str, str] = None) -> List[Dict]:
         """
@@ -34,54 +62,130 @@ class ShowProcessor:
         Returns:
             List of show dictionaries with all extracted information
         """
-        # Fetch posts
-        posts = self.scraper.get_multiple_profiles_posts(usernames, max_posts_per_profile, days_back)
+        # Fetch posts on a producer thread; each profile is parsed, and its OCR started,
+        # while the scraper waits out the rate-limit delay and fetches the next profile
+        profiles_queue = queue.Queue(maxsize=2)
+        producer_errors = []
+        stop_producing = threading.Event()  # Set if the consumer below fails
         
-        shows = []
+        def produce():
+            try:
+                for profile_posts in self.scraper.iter_profiles_posts(usernames, max_posts_per_profile, days_back):
+                    profiles_queue.put(profile_posts)
+                    if stop_producing.is_set():
+                        break
+            except Exception as e:
+                producer_errors.append(e)
+            finally:
+                profiles_queue.put(None)
         
-        for post in posts:
-            # First, try to extract info from caption
-            caption_info = self.text_parser.parse_show_info(
-                post['caption'],
-                post['timestamp']
-            )
-            
-            # Only process if it's identified as a show post
-            if not caption_info['is_show']:
-                continue
-            
-            # Get nickname if available
-            display_name = post['username']
-            if nickname_map and post['username'] in nickname_map:
-                display_name = nickname_map[post['username']]
-            
-            show_info = {
-                'post_url': post['post_url'],
-                'username': post['username'],
-                'display_name': display_name,
-                'caption': post['caption'],
-                'date': caption_info['date'],
-                'location': caption_info['location'] or 'Unknown',
-                'time': caption_info['time'] or 'Unknown',
-            }
-            
-            # If we're missing date or location, try OCR on the image
-            if (not show_info['date'] or show_info['location'] == 'Unknown') and post['local_image_path']:
-                ocr_info = self.ocr_extractor.extract_show_info_from_image(
-                    post['local_image_path'],
-                    post['timestamp']
-                )
-                
-                # Fill in missing information from OCR
-                if not show_info['date'] and ocr_info['date']:
-                    show_info['date'] = ocr_info['date']
-                
-                if show_info['location'] == 'Unknown' and ocr_info['location']:
-                    show_info['location'] = ocr_info['location']
+        def drain():
+            # Unblock the producer after a failure, deleting the images it still hands over
+            for profile_posts in iter(profiles_queue.get, None):
+                remove_files([post['local_image_path'] for post in profile_posts if post['local_image_path']])
+        
+        threading.Thread(target=produce, daemon=True).start()
+        
+        image_paths = []  # Every downloaded image, deleted once OCR is done
+        consumed_all = False
+        candidates = []  # (post, show_info) for every show post
+        ocr_batches = []  # (batch of candidates, future with their OCR results)
+        ocr_available = self.ocr_extractor.tesseract_available
+        parse_batch = self.text_parser.parse_batch
+        is_ocr_candidate = self.is_ocr_candidate
+        nickname_map = nickname_map or {}
+        
+        try:
+            with ThreadPoolExecutor(max_workers=self.OCR_WORKERS) as executor:
+                while True:
+                    profile_posts = profiles_queue.get()
+                    if profile_posts is None:
+                        consumed_all = True
+                        break
+                    image_paths.extend(post['local_image_path'] for post in profile_posts if post['local_image_path'])
+                    
+                    ocr_jobs = []  # Candidates whose caption is missing the date or location
+                    
+                    # Skip captions that can't be show posts without running the parser
+                    hinted_posts = [
+                        post for post in profile_posts
+                        if post['caption'] and _SHOW_HINT_RE.search(post['caption'])
+                    ]
+                    
+                    # First, try to extract info from caption
+                    caption_infos = parse_batch([(post['caption'], post['timestamp']) for post in hinted_posts])
+                    
+                    for post, caption_info in zip(hinted_posts, caption_infos):
+                        caption = post['caption']
+                        
+                        # Only process if it's identified as a show post
+                        if not caption_info['is_show']:
+                            continue
+                        
+                        username = post['username']
+                        image_path = post['local_image_path']
+                        
+                        show_info = {
+                            'post_url': post['post_url'],
+                            'username': username,
+                            # Get nickname if available
+                            'display_name': nickname_map.get(username, username),
+                            'caption': caption,
+                            'date': caption_info['date'],
+                            'location': caption_info['location'] or 'Unknown',
+                            'time': caption_info['time'] or 'Unknown',
+                        }
+                        candidates.append((post, show_info))
+                        
+                        # If we're missing date or location, try OCR on the image
+                        if (ocr_available
+                                and (not show_info['date'] or show_info['location'] == 'Unknown')
+                                and image_path
+                                and is_ocr_candidate(image_path)):
+                            ocr_jobs.append((post, show_info))
+                    
+                    # OCR the images in a few batches; each batch is a single tesseract run,
+                    # and the batches run in parallel since tesseract is its own process
+                    if ocr_jobs:
+                        batch_count = min(self.OCR_WORKERS, len(ocr_jobs))
+                        for i in range(batch_count):
+                            batch = ocr_jobs[i::batch_count]
+                            future = executor.submit(
+                                self.ocr_extractor.extract_show_info_from_images,
+                                [post['local_image_path'] for post, _ in batch],
+                                [post['timestamp'] for post, _ in batch]
+                            )
+                            ocr_batches.append((batch, future))
                 
-                if show_info['time'] == 'Unknown' and ocr_info['time']:
-                    show_info['time'] = ocr_info['time']
+                for batch, future in ocr_batches:
+                    for (post, show_info), ocr_info in zip(batch, future.result()):
+                        # Fill in missing information from OCR
+                        if not show_info['date'] and ocr_info['date']:
+                            show_info['date'] = ocr_info['date']
+                        
+                        if show_info['location'] == 'Unknown' and ocr_info['location']:
+                            show_info['location'] = ocr_info['location']
+                        
+                        if show_info['time'] == 'Unknown' and ocr_info['time']:
+                            show_info['time'] = ocr_info['time']
+        finally:
+            if not consumed_all:
+                stop_producing.set()
+                threading.Thread(target=drain, daemon=True).start()
             
+            # Clean up temporary image files without holding up the results
+            if image_paths:
+                threading.Thread(target=remove_files, args=(image_paths,), daemon=True).start()
+        
+        if producer_errors:
+            raise producer_errors[0]
+        
+        # Newest first across all profiles, as the combined post list was ordered
+        candidates.sort(key=lambda candidate: candidate[0]['timestamp'], reverse=True)
+        
+        shows = []
+        
+        for post, show_info in candidates:
             # Set defaults for missing info
             if not show_info['date']:
                 show_info['date'] = 'Unknown'
@@ -89,12 +193,20 @@ class ShowProcessor:
             # Only add shows with at least a date or location
             if show_info['date'] != 'Unknown' or show_info['location'] != 'Unknown':
                 shows.append(show_info)
-            
-            # Clean up temporary image file
-            if post['local_image_path'] and os.path.exists(post['local_image_path']):
-                try:
-                    os.remove(post['local_image_path'])
-                except:
-                    pass
         
         return shows
+    
+    def is_ocr_candidate(self, image_path: str) -> bool:
+        """
+        Check whether an image is worth running OCR on.
+        
+        Args:
+            image_path: Path to the downloaded image
+            
+        Returns:
+            True if the image exists and is large enough to contain legible text
+        """
+        try:
+            return os.path.getsize(image_path) >= self.MIN_OCR_IMAGE_BYTES
+        except OSError:
+            return False
@@ -0,0 +1,29 @@
+"""
+Regression tests for location extraction in the text parser.
+"""
+import unittest
+
+from text_parser import ShowTextParser
+
+
+class ExtractLocationTests(unittest.TestCase):
+    """Venue names that the location patterns must keep recognising."""
+    
+    def setUp(self):
+        self.parser = ShowTextParser()
+    
+    def test_suffix_inside_a_longer_word(self):
+        location = self.parser.extract_location("Live at Red Rocks Amphitheatre this Friday")
+        self.assertEqual(location, "Red Rocks Amphitheatre")
+    
+    def test_all_caps_caption(self):
+        location = self.parser.extract_location("LIVE AT THE FILLMORE")
+        self.assertEqual(location, "THE FILLMORE")
+    
+    def test_lowercase_article_before_venue(self):
+        location = self.parser.extract_location("Tonight at the Bowery Ballroom")
+        self.assertEqual(location, "the Bowery Ballroom")
+
+
+if __name__ == '__main__':
+    unittest.main()
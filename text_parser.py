@@ -2,11 +2,119 @@
 Text parser module to detect show posts and extract information.
 """
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from dateutil import parser as date_parser
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, Optional, Sequence, Tuple
 import calendar
 
+try:
+    # Optional: scans for every keyword in one pass when installed
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Month and weekday numbers keyed by their three-letter prefix (fixed English
+# names, since calendar.month_abbr follows the locale Tk sets at startup)
+_MONTHS = {name: number for number, name in enumerate(
+    ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1)}
+_WEEKDAYS = {name: number for number, name in enumerate(
+    ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun'))}
+
+_NUMBER_RE = re.compile(r'\d+')
+
+# Relative dates ('tonight', 'tomorrow') are placed at this hour
+_SHOW_HOUR = 20
+_ONE_DAY = timedelta(days=1)
+
+
+def _evening_of(day: datetime) -> datetime:
+    """Return the show hour on the given day."""
+    return day.replace(hour=_SHOW_HOUR, minute=0, second=0, microsecond=0)
+
+
+def _parse_month_day(match, default: datetime) -> Optional[datetime]:
+    """Parse 'Jan 5th' or 'January 5, 2025'."""
+    numbers = _NUMBER_RE.findall(match.group(0))
+    month = _MONTHS[match.group(1)[:3].lower()]
+    if len(numbers) == 2:
+        return default.replace(year=int(numbers[1]), month=month, day=int(numbers[0]))
+    return default.replace(month=month, day=int(numbers[0]))
+
+
+def _parse_day_month(match, default: datetime) -> Optional[datetime]:
+    """Parse '5th December' or '5 of Dec'."""
+    day = int(_NUMBER_RE.search(match.group(0)).group())
+    return default.replace(month=_MONTHS[match.group(1)[:3].lower()], day=day)
+
+
+def _parse_weekday_day(match, default: datetime) -> Optional[datetime]:
+    """Parse 'Friday 5th'; the day number wins over the weekday."""
+    if re.search(r'\bthe\b', match.group(0), re.IGNORECASE):
+        return None
+    return default.replace(day=int(_NUMBER_RE.search(match.group(0)).group()))
+
+
+def _parse_weekday(match, default: datetime) -> Optional[datetime]:
+    """Parse 'on Friday' as the next Friday on or after the post date."""
+    if match.group(0)[:2].lower() not in ('on', 'at'):
+        return None
+    return default + timedelta(days=(_WEEKDAYS[match.group(1)[:3].lower()] - default.weekday()) % 7)
+
+
+def _parse_relative_day(match, default: datetime) -> Optional[datetime]:
+    """'tonight'/'tomorrow'/'today' are handled after the pattern scan."""
+    return None
+
+
+def _parse_numeric_date(match, default: datetime) -> Optional[datetime]:
+    """Numeric dates are ambiguous (MM/DD vs DD/MM), so leave them to dateutil."""
+    return date_parser.parse(match.group(0), default=default)
+
+
+# Month and weekday alternations with shared prefixes factored out, so each
+# position tries a handful of branches instead of one per spelling
+_MONTH_NAMES = (r'(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?'
+                r'|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)')
+_WEEKDAY_NAMES = r'(Mon(?:day)?|Tue(?:sday)?|Wed(?:nesday)?|Thu(?:rsday)?|Fri(?:day)?|Sat(?:urday)?|Sun(?:day)?)'
+
+# Common date patterns, each with the callback that turns a match into a datetime.
+# The (?=[...]) lookaheads reject most positions on their first letter before
+# any alternation is tried.
+_DATE_PATTERNS = [(re.compile(pattern, re.IGNORECASE), parse_match) for pattern, parse_match in (
+    (r'\b(?=[adfjmnos])' + _MONTH_NAMES + r'\s+\d{1,2}(?:st|nd|rd|th)?(?:,\s*\d{4})?\b', _parse_month_day),
+    (r'\b\d{1,2}[/-]\d{1,2}(?:[/-]\d{2,4})?\b', _parse_numeric_date),  # MM/DD/YYYY or DD/MM/YYYY
+    (r'\b(?=[mtwfs])' + _WEEKDAY_NAMES + r'\s+(?:the\s+)?\d{1,2}(?:st|nd|rd|th)?\b', _parse_weekday_day),
+    (r'\b(?=[oatn])(?:on|at|this|next)\s+' + _WEEKDAY_NAMES + r'\b', _parse_weekday),
+    (r'\bto(?:night|morrow|day)\b', _parse_relative_day),
+    (r'\b\d{1,2}(?:st|nd|rd|th)?\s+(?:of\s+)?' + _MONTH_NAMES + r'\b', _parse_day_month)
+)]
+
+# Time patterns; none can start or end on whitespace, so matches need no strip()
+_TIME_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\b\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)\b',
+    r'\b\d{1,2}:\d{2}\b',
+    r'\b(?:doors|show|starts?)\s+(?:at|@)?\s*\d{1,2}(?::\d{2})?(?:\s*(?:AM|PM|am|pm))?\b'
+)]
+
+# Common location indicators. Names are case-sensitive so [A-Z] really means a
+# capitalised name (after an optional 'the'), and they are matched word by word with
+# a bounded count so a long caption can't make the suffix search backtrack over the
+# whole text. Venue suffixes match in any case ('Amphitheatre', 'BALLROOM HALL').
+_LOCATION_PREFIX = r'(?:[Aa]t|AT|@)\s+'
+_LOCATION_NAME_START = r'(?:(?:[Tt]he|THE)\s+)?[A-Z]'
+_LOCATION_PATTERNS = [re.compile(pattern) for pattern in (
+    _LOCATION_PREFIX + r'(' + _LOCATION_NAME_START
+    + r'[a-zA-Z&]*(?:\s+[A-Za-z&]+){0,5}\s*(?i:Theatre|Theater|Hall|Venue|Club|Bar|Lounge|Cafe|Café|Pub|Arena|Stadium))\b',
+    _LOCATION_PREFIX + r'(' + _LOCATION_NAME_START + r'[a-zA-Z&]+(?:\s+[A-Za-z&]+){0,5})',
+    r'@([a-zA-Z0-9_]+)',  # Instagram location tags
+)]
+
+# Every position where the venue/generic patterns could start
+_LOCATION_START_RE = re.compile(r'(?=' + _LOCATION_PREFIX + _LOCATION_NAME_START + r')')
+
 
 class ShowTextParser:
     """Parses text to detect shows and extract date/location information."""
@@ -19,25 +127,32 @@ class ShowTextParser:
         'tonight', 'this week', 'coming', 'upcoming'
     ]
     
-    # Common date patterns
-    DATE_PATTERNS = [
-        r'\b(Jan|January|Feb|February|Mar|March|Apr|April|May|Jun|June|Jul|July|Aug|August|Sep|September|Oct|October|Nov|November|Dec|December)\s+\d{1,2}(?:st|nd|rd|th)?(?:,\s*\d{4})?\b',
-        r'\b\d{1,2}[/-]\d{1,2}(?:[/-]\d{2,4})?\b',  # MM/DD/YYYY or DD/MM/YYYY
-        r'\b(Mon|Monday|Tue|Tuesday|Wed|Wednesday|Thu|Thursday|Fri|Friday|Sat|Saturday|Sun|Sunday)\s+(?:the\s+)?\d{1,2}(?:st|nd|rd|th)?\b',
-        r'\b(?:on|at|this|next)\s+(Mon|Monday|Tue|Tuesday|Wed|Wednesday|Thu|Thursday|Fri|Friday|Sat|Saturday|Sun|Sunday)\b',
-        r'\b(?:tonight|tomorrow|today)\b',
-        r'\b\d{1,2}(?:st|nd|rd|th)?\s+(?:of\s+)?(Jan|January|Feb|February|Mar|March|Apr|April|May|Jun|June|Jul|July|Aug|August|Sep|September|Oct|October|Nov|November|Dec|December)\b'
-    ]
+    # Words that mark a dated post as an event
+    EVENT_WORDS = ['ticket', 'door', 'venue', 'stage', 'live']
     
-    # Time patterns
-    TIME_PATTERNS = [
-        r'\b\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)\b',
-        r'\b\d{1,2}:\d{2}\b',
-        r'\b(?:doors|show|starts?)\s+(?:at|@)?\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm)?\b'
-    ]
+    # Keyword automaton shared by every instance (None if pyahocorasick isn't installed)
+    _keyword_automaton = None
     
     def __init__(self):
-        self.current_year = datetime.now().year
+        # Identical captions posted on the same day are parsed once
+        self._parse_cached = lru_cache(maxsize=4096)(self._parse_show_info)
+        if ahocorasick is not None and ShowTextParser._keyword_automaton is None:
+            ShowTextParser._keyword_automaton = self.build_keyword_automaton()
+    
+    @classmethod
+    def build_keyword_automaton(cls):
+        """
+        Build an Aho-Corasick automaton over the show keywords and event words.
+        
+        Returns:
+            Automaton whose values are (show keyword bit or 0, is_event_word)
+        """
+        keyword_bits = {keyword: 1 << index for index, keyword in enumerate(cls.SHOW_KEYWORDS)}
+        automaton = ahocorasick.Automaton()
+        for word in set(cls.SHOW_KEYWORDS) | set(cls.EVENT_WORDS):
+            automaton.add_word(word, (keyword_bits.get(word, 0), word in cls.EVENT_WORDS))
+        automaton.make_automaton()
+        return automaton
     
     def is_show_post(self, text: str) -> bool:
         """
@@ -49,31 +164,84 @@ class ShowTextParser:
         Returns:
             True if post appears to be about a show
         """
+        return self._classify(text)[0]
+    
+    def _classify(self, text: str) -> Tuple[bool, Optional[Tuple[int, re.Match]]]:
+        """
+        Decide whether a post is about a show, keeping any date match found on the way.
+        
+        Args:
+            text: Post caption text
+            
+        Returns:
+            Tuple of (is_show, first date match) where the first date match is
+            (index into _DATE_PATTERNS, match) if the date patterns were scanned
+            and one of them matched; every earlier pattern had no match
+        """
         if not text:
-            return False
+            return False, None
         
         text_lower = text.lower()
         
-        # Check for show keywords
-        keyword_count = sum(1 for keyword in self.SHOW_KEYWORDS if keyword in text_lower)
-        
-        # If multiple keywords found, likely a show post
+        # Check for show keywords; if multiple keywords found, likely a show post
+        keyword_count, has_event_word = self.scan_keywords(text_lower)
         if keyword_count >= 2:
-            return True
+            return True, None
         
-        # Check for date patterns combined with event-related words
-        has_date = any(re.search(pattern, text, re.IGNORECASE) for pattern in self.DATE_PATTERNS)
-        has_event_word = any(word in text_lower for word in ['ticket', 'door', 'venue', 'stage', 'live'])
+        # Check for date patterns combined with event-related words; the event word
+        # check is already done, so the date regexes only run when it passed
+        if not has_event_word:
+            return False, None
         
-        return has_date and has_event_word
+        for index, (pattern, _) in enumerate(_DATE_PATTERNS):
+            match = pattern.search(text)
+            if match:
+                return True, (index, match)
+        
+        return False, None
     
-    def extract_date(self, text: str, post_timestamp: datetime) -> Optional[datetime]:
+    def scan_keywords(self, text_lower: str) -> Tuple[int, bool]:
+        """
+        Count distinct show keywords and check for event words.
+        
+        Counting stops at two keywords, since that already marks a show post.
+        
+        Args:
+            text_lower: Lowercased post caption text
+            
+        Returns:
+            Tuple of (show keyword count, whether an event word appears)
+        """
+        if self._keyword_automaton is not None:
+            # One bit per distinct keyword; a second bit set means two keywords
+            keywords_found = 0
+            has_event_word = False
+            for _, (keyword_bit, is_event_word) in self._keyword_automaton.iter(text_lower):
+                keywords_found |= keyword_bit
+                if keywords_found & (keywords_found - 1):
+                    return 2, has_event_word
+                has_event_word = has_event_word or is_event_word
+            return (1 if keywords_found else 0), has_event_word
+        
+        keyword_count = 0
+        for keyword in self.SHOW_KEYWORDS:
+            if keyword in text_lower:
+                keyword_count += 1
+                if keyword_count >= 2:
+                    return keyword_count, False
+        
+        has_event_word = any(word in text_lower for word in self.EVENT_WORDS)
+        
+        return keyword_count, has_event_word
+    
+    def extract_date(self, text: str, post_timestamp: datetime, first_date_match: Optional[Tuple[int, re.Match]] = None) -> Optional[datetime]:
         """
         Extract date from text.
         
         Args:
             text: Post caption text
             post_timestamp: When the post was made (for context)
+            first_date_match: First date match already found by _classify, if any
             
         Returns:
             Parsed datetime or None
@@ -81,31 +249,42 @@ class ShowTextParser:
         if not text:
             return None
         
+        # Patterns before the already found match are known not to match, and the
+        # scan of its own pattern resumes right after it
+        start = 0
+        if first_date_match:
+            start, first_match = first_date_match
+        
+        post_day_start = post_timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+        
         # Try to find date patterns
-        for pattern in self.DATE_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for index in range(start, len(_DATE_PATTERNS)):
+            pattern, parse_match = _DATE_PATTERNS[index]
+            if first_date_match and index == start:
+                matches = chain((first_match,), pattern.finditer(text, first_match.end()))
+            else:
+                matches = pattern.finditer(text)
             for match in matches:
-                date_str = match.group(0)
                 try:
-                    # Try parsing with dateutil
-                    parsed_date = date_parser.parse(date_str, default=post_timestamp)
+                    parsed_date = parse_match(match, post_timestamp)
+                    if parsed_date is None:
+                        continue
                     
                     # Only accept future dates or dates within reasonable range
-                    if parsed_date >= post_timestamp.replace(hour=0, minute=0, second=0, microsecond=0):
+                    if parsed_date >= post_day_start:
                         return parsed_date
                     # Also accept dates in the past if they're close (within 7 days)
                     elif (post_timestamp - parsed_date).days <= 7:
                         return parsed_date
-                except:
+                except (ValueError, TypeError, OverflowError):
                     continue
         
         # Check for relative dates
         text_lower = text.lower()
         if 'tonight' in text_lower or 'today' in text_lower:
-            return post_timestamp.replace(hour=20, minute=0, second=0, microsecond=0)
+            return _evening_of(post_timestamp)
         elif 'tomorrow' in text_lower:
-            from datetime import timedelta
-            return (post_timestamp + timedelta(days=1)).replace(hour=20, minute=0, second=0, microsecond=0)
+            return _evening_of(post_timestamp + _ONE_DAY)
         
         return None
     
@@ -122,19 +301,27 @@ class ShowTextParser:
         if not text:
             return None
         
-        # Common location indicators
-        location_patterns = [
-            r'(?:at|@)\s+([A-Z][a-zA-Z\s&]+(?:Theatre|Theater|Hall|Venue|Club|Bar|Lounge|Cafe|Café|Pub|Arena|Stadium))',
-            r'(?:at|@)\s+([A-Z][a-zA-Z\s&]{3,30})',
-            r'@([a-zA-Z0-9_]+)',  # Instagram location tags
-        ]
+        # One scan finds the candidate starts; the patterns are only tried there
+        starts = [match.start() for match in _LOCATION_START_RE.finditer(text)]
+        for pattern in _LOCATION_PATTERNS[:2]:
+            end = 0
+            for start in starts:
+                if start < end:
+                    continue
+                match = pattern.match(text, start)
+                if match:
+                    location = match.group(1)
+                    if len(location) > 2 and len(location) < 100:
+                        return location
+                    end = match.end()
         
-        for pattern in location_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                location = match.group(1).strip()
+        if '@' in text:
+            match = _LOCATION_PATTERNS[2].search(text)
+            while match:
+                location = match.group(1)
                 if len(location) > 2 and len(location) < 100:
                     return location
+                match = _LOCATION_PATTERNS[2].search(text, match.end())
         
         return None
     
@@ -151,10 +338,10 @@ class ShowTextParser:
         if not text:
             return None
         
-        for pattern in self.TIME_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in _TIME_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
-                return match.group(0).strip()
+                return match.group(0)
         
         return None
     
@@ -169,24 +356,66 @@ class ShowTextParser:
         Returns:
             Dictionary with date, location, time, and other info
         """
-        info = {
-            'date': None,
-            'location': None,
-            'time': None,
-            'is_show': False
+        if not caption:
+            return {
+                'date': None,
+                'location': None,
+                'time': None,
+                'is_show': False
+            }
+        
+        # Only the day of the post affects the result, so it is the cache key
+        day_start = post_timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+        date, location, time, is_show = self._parse_cached(caption, day_start)
+        
+        return {
+            'date': date,
+            'location': location,
+            'time': time,
+            'is_show': is_show
         }
+    
+    def parse_batch(self, items: Sequence[Tuple[str, datetime]]) -> List[Dict[str, Optional[str]]]:
+        """
+        Parse show information for many posts at once.
         
-        if not caption:
-            return info
+        Captions repeated on the same day (reposts, pagination retries) are
+        parsed once and the result is shared.
         
-        info['is_show'] = self.is_show_post(caption)
+        Args:
+            items: (caption, post_timestamp) pairs
+            
+        Returns:
+            List of dictionaries as returned by parse_show_info, in the same order
+        """
+        parsed = {}
+        results = []
+        for caption, post_timestamp in items:
+            key = (caption, post_timestamp.date())
+            info = parsed.get(key)
+            if info is None:
+                info = parsed[key] = self.parse_show_info(caption, post_timestamp)
+            results.append(dict(info))
+        return results
+    
+    def _parse_show_info(self, caption: str, post_timestamp: datetime) -> Tuple[Optional[str], Optional[str], Optional[str], bool]:
+        """
+        Uncached parse behind parse_show_info.
         
-        if info['is_show']:
-            parsed_date = self.extract_date(caption, post_timestamp)
-            if parsed_date:
-                info['date'] = parsed_date.strftime('%Y-%m-%d')
+        Args:
+            caption: Post caption
+            post_timestamp: Start of the day the post was made
             
-            info['location'] = self.extract_location(caption)
-            info['time'] = self.extract_time(caption)
+        Returns:
+            Tuple of (date, location, time, is_show)
+        """
+        is_show, first_date_match = self._classify(caption)
+        if not is_show:
+            return None, None, None, False
+        
+        date = None
+        parsed_date = self.extract_date(caption, post_timestamp, first_date_match)
+        if parsed_date:
+            date = parsed_date.strftime('%Y-%m-%d')
         
-        return info
+        return date, self.extract_location(caption), self.extract_time(caption), True